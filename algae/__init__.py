@@ -0,0 +1,89 @@
+"""Option, Either and Try for Python.
+
+The names below are exported lazily: ``import algae`` doesn't import any
+submodule, and the first access to a name imports only the submodule that
+defines it, so that the batch, parallel and NumPy integrations are never
+loaded by code that doesn't use them.
+"""
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from algae import (
+        batch,
+        binary,
+        cache,
+        circuit,
+        instrumentation,
+        json_codec,
+        parallel,
+        stream,
+        timeout,
+        validated,
+    )
+    from algae.batch import EitherArray, OptionArray, TryBatch, ValidatedBatch
+    from algae.cache import CacheInfo, try_lru_cache
+    from algae.circuit import CircuitBreaker, CircuitOpenError, circuit_breaker
+    from algae.either import Either, LazyEither, Left, Right
+    from algae.option import LazyOption, NoElement, Nothing, Option, Some
+    from algae.timeout import Deadline
+    from algae.try_ import Failure, LazyTry, Success, Try, set_lightweight_failures
+    from algae.validated import Invalid, Valid, Validated
+
+_EXPORTS = {
+    "Option": "algae.option",
+    "Some": "algae.option",
+    "Nothing": "algae.option",
+    "NoElement": "algae.option",
+    "LazyOption": "algae.option",
+    "Either": "algae.either",
+    "Left": "algae.either",
+    "Right": "algae.either",
+    "LazyEither": "algae.either",
+    "Try": "algae.try_",
+    "Success": "algae.try_",
+    "Failure": "algae.try_",
+    "LazyTry": "algae.try_",
+    "set_lightweight_failures": "algae.try_",
+    "OptionArray": "algae.batch",
+    "EitherArray": "algae.batch",
+    "TryBatch": "algae.batch",
+    "ValidatedBatch": "algae.batch",
+    "try_lru_cache": "algae.cache",
+    "CacheInfo": "algae.cache",
+    "CircuitBreaker": "algae.circuit",
+    "CircuitOpenError": "algae.circuit",
+    "circuit_breaker": "algae.circuit",
+    "Validated": "algae.validated",
+    "Valid": "algae.validated",
+    "Invalid": "algae.validated",
+    "Deadline": "algae.timeout",
+}
+_SUBMODULES = {
+    "batch",
+    "binary",
+    "cache",
+    "circuit",
+    "instrumentation",
+    "json_codec",
+    "parallel",
+    "stream",
+    "timeout",
+    "validated",
+}
+
+__all__ = sorted([*_EXPORTS, *_SUBMODULES])
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(__import__(_EXPORTS[name], fromlist=(name,)), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        # importing a submodule binds it as an attribute of the package
+        __import__(f"algae.{name}")
+        return globals()[name]
+    raise AttributeError(f"module 'algae' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,778 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain, compress
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from algae.either import Either, Left, Right
+from algae.option import _NOTHING, Nothing, Option, Some
+from algae.try_ import Failure, Success, Try
+from algae.validated import Invalid, Valid, Validated
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+E = TypeVar("E")
+L = TypeVar("L")
+R = TypeVar("R")
+T = TypeVar("T")
+U = TypeVar("U")
+
+_BITS = [tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)]
+_POPCOUNT = bytes(bin(byte).count("1") for byte in range(256))
+_INVERTED = bytes(255 - byte for byte in range(256))
+
+
+def _pack(flags: Any) -> bytes:
+    """Pack booleans into a little-endian bitmap, the layout Arrow uses."""
+    if np is not None:
+        return np.packbits(np.asarray(flags, dtype=bool), bitorder="little").tobytes()
+    bitmap = bytearray((len(flags) + 7) >> 3)
+    for i in compress(range(len(flags)), flags):
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return bytes(bitmap)
+
+
+def _unpack(bitmap: bytes, length: int, ndarray: bool = False) -> Any:
+    if ndarray:
+        return np.unpackbits(
+            np.frombuffer(bitmap, dtype=np.uint8), count=length, bitorder="little"
+        ).astype(bool)
+    return list(chain.from_iterable(map(_BITS.__getitem__, bitmap)))[:length]
+
+
+def _invert(bitmap: bytes, length: int) -> bytes:
+    inverted = bytearray(bitmap.translate(_INVERTED))
+    if length & 7:
+        inverted[-1] &= (1 << (length & 7)) - 1
+    return bytes(inverted)
+
+
+def _numeric_typecode(values: List[Any], flags: List[bool]) -> Optional[str]:
+    """Return the array typecode of values that are all int or all float.
+
+    Columns mixing ints and floats, or holding anything else, aren't packed
+    as converting them would change the values.
+    """
+    kinds = set(map(type, compress(values, flags)))
+    if kinds == {int}:
+        return "q"
+    if kinds == {float}:
+        return "d"
+    return None
+
+
+def _buffer(values: List[Any], flags: List[bool]) -> Any:
+    """Store values contiguously when they are all ints or all floats, as a list otherwise.
+
+    Numeric buffers are NumPy arrays when NumPy is installed and ``array.array``
+    otherwise; missing slots are filled with zero so they stay dense.
+    """
+    typecode = _numeric_typecode(values, flags)
+    if typecode is None:
+        return [value if flag else None for value, flag in zip(values, flags)]
+    filled = [value if flag else 0 for value, flag in zip(values, flags)]
+    try:
+        if np is not None:
+            return np.array(filled, dtype=np.int64 if typecode == "q" else np.float64)
+        return array(typecode, filled)
+    except OverflowError:
+        return [value if flag else None for value, flag in zip(values, flags)]
+
+
+def _from_buffer(data: Any) -> Any:
+    """Wrap a one-dimensional buffer without copying it.
+
+    The buffer is read as a NumPy array when NumPy is installed, and through
+    a memoryview otherwise.
+    """
+    if _is_ndarray(data):
+        view = data
+    else:
+        view = memoryview(data)
+        if np is not None:
+            view = np.asarray(view)
+    if view.ndim != 1:
+        raise ValueError("buffers must be one-dimensional")
+    return view
+
+
+def _bitmap(bitmap: Any, length: int) -> bytes:
+    """Copy the bits of a little-endian bitmap covering length slots, clearing the others."""
+    size = (length + 7) >> 3
+    bitmap = bytes(memoryview(bitmap).cast("B")[:size])
+    if len(bitmap) < size:
+        raise ValueError(f"a bitmap of {length} slots needs {size} bytes")
+    if length & 7:
+        bitmap = bitmap[:-1] + bytes([bitmap[-1] & (1 << (length & 7)) - 1])
+    return bitmap
+
+
+def _buffer_length(values: Any, length: Optional[int]) -> int:
+    """Check that a column of length slots fits in the values buffer."""
+    if length is None:
+        return len(values)
+    if not 0 <= length <= len(values):
+        raise ValueError(
+            f"a column of {length} slots doesn't fit a buffer of {len(values)} values"
+        )
+    return length
+
+
+def _export(values: Any) -> memoryview:
+    if isinstance(values, list):
+        raise TypeError("only numeric columns are stored in a buffer")
+    return memoryview(values)
+
+
+def _is_ndarray(values: Any) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _vectorized(f: Callable[[Any], Any], values: Any, flags: Any = None) -> Any:
+    """Apply f at once to the valid slots of a NumPy buffer, or return None if it can't be.
+
+    Only the slots whose flag is set are passed to f, and the others hold zero
+    in the result. Floating point errors raise instead of producing inf or nan,
+    and functions that raise or that return something other than an array of
+    the same shape are applied element by element instead, so that they raise
+    or return exactly what they do on a single value.
+    """
+    if not _is_ndarray(values):
+        return None
+    valid = values if flags is None else values[flags]
+    try:
+        with np.errstate(all="raise"):
+            result = f(valid)
+    except Exception:
+        return None
+    if not (
+        isinstance(result, np.ndarray)
+        and result.shape == valid.shape
+        and result.dtype.kind in "biuf"
+    ):
+        return None
+    if flags is None:
+        return result
+    scattered = np.zeros(values.shape, dtype=result.dtype)
+    scattered[flags] = result
+    return scattered
+
+
+def _item(values: Any, i: int) -> Any:
+    return values.item(i) if _is_ndarray(values) else values[i]
+
+
+def _iter_values(values: Any) -> Iterator[Any]:
+    return iter(values.tolist()) if _is_ndarray(values) else iter(values)
+
+
+def _compress(values: Any, flags: Any) -> Any:
+    """Keep the values whose flag is set, in a buffer of the same kind."""
+    if _is_ndarray(values):
+        return values[flags]
+    if isinstance(values, array):
+        return array(values.typecode, compress(values, flags))
+    return list(compress(values, flags))
+
+
+class OptionArray(Generic[T]):
+    """A column of optional values.
+
+    Values are held in one contiguous buffer, plus a validity bitmap marking
+    which slots are Some, rather than as one Option object per element.
+
+    Numeric columns are stored in NumPy arrays when it is installed, and map,
+    filter and fold can then be vectorized by passing ``vectorize=True``: the
+    function is called once with an array of the Some values, and is applied
+    element by element instead if it raises or doesn't return an array of the
+    same shape. Floating point errors raise, but integers are 64 bits and wrap
+    around on overflow, as they do in NumPy.
+    """
+
+    __slots__ = ("_values", "_validity", "_length")
+
+    def __init__(self, values: Any, validity: bytes, length: int):
+        self._values = values
+        self._validity = validity
+        self._length = length
+
+    @staticmethod
+    def apply(values: Iterable[Optional[T]]) -> OptionArray[T]:
+        """Build a column where None is Nothing, like Option.apply."""
+        values = list(values)
+        return OptionArray._from_flags(values, [value is not None for value in values])
+
+    @staticmethod
+    def from_options(options: Iterable[Option[T]]) -> OptionArray[T]:
+        options = list(options)
+        flags = [not option._is_empty() for option in options]
+        values = [
+            option._value if flag else None for option, flag in zip(options, flags)
+        ]
+        return OptionArray._from_flags(values, flags)
+
+    @staticmethod
+    def _from_flags(values: List[Any], flags: List[bool]) -> OptionArray[Any]:
+        return OptionArray(_buffer(values, flags), _pack(flags), len(flags))
+
+    @staticmethod
+    def from_buffers(
+        values: Any, validity: Any, length: Optional[int] = None
+    ) -> OptionArray[Any]:
+        """Build a column on top of a values buffer and a validity bitmap.
+
+        Both are objects supporting the buffer protocol, laid out as buffers
+        returns them. The values aren't copied, only the bitmap is.
+        """
+        values = _from_buffer(values)
+        length = _buffer_length(values, length)
+        return OptionArray(values, _bitmap(validity, length), length)
+
+    @staticmethod
+    def from_masked(masked: Any) -> OptionArray[Any]:
+        """Build a column from a numpy.ma masked array, sharing its data.
+
+        Masked slots are Nothing.
+        """
+        if np is None:
+            raise ImportError("from_masked requires NumPy")
+        values = _from_buffer(np.ma.getdata(masked))
+        return OptionArray(values, _pack(~np.ma.getmaskarray(masked)), len(values))
+
+    def buffers(self) -> Tuple[memoryview, memoryview]:
+        """Return the values buffer and the validity bitmap, without copying them.
+
+        The bitmap is little-endian, as in Arrow, and as in Arrow the values
+        in the Nothing slots are undefined: a filtered column, or one built on
+        existing buffers, keeps whatever values were there. Only numeric
+        columns are stored in a buffer, others raise a TypeError.
+        """
+        return _export(self._values), memoryview(self._validity)
+
+    def to_masked(self) -> Any:
+        """Return a numpy.ma masked array sharing the values of a numeric column."""
+        if np is None:
+            raise ImportError("to_masked requires NumPy")
+        return np.ma.masked_array(
+            np.asarray(self._values),
+            mask=~_unpack(self._validity, self._length, True),
+            copy=False,
+        )
+
+    def _flags(self) -> Any:
+        return _unpack(self._validity, self._length, _is_ndarray(self._values))
+
+    def _is_valid(self, i: int) -> bool:
+        return bool(self._validity[i >> 3] >> (i & 7) & 1)
+
+    @property
+    def null_count(self) -> int:
+        return self._length - sum(self._validity.translate(_POPCOUNT))
+
+    def map(self, f: Callable[[T], U], vectorize: bool = False) -> OptionArray[U]:
+        """Apply f to every value, like Option.map.
+
+        With vectorize set, f is first called with a NumPy array of the values
+        of a numeric column, and NumPy semantics apply, see OptionArray.
+        """
+        flags = self._flags()
+        if vectorize:
+            result = _vectorized(f, self._values, flags)
+            if result is not None:
+                return OptionArray(result, self._validity, self._length)
+        values = [
+            f(value) if flag else None
+            for value, flag in zip(_iter_values(self._values), flags)
+        ]
+        return OptionArray._from_flags(values, list(flags))
+
+    def flat_map(self, f: Callable[[T], Option[U]]) -> OptionArray[U]:
+        """Apply f to every value; f returns an Option, so it runs per element."""
+        values = [
+            f(value) if flag else _NOTHING
+            for value, flag in zip(_iter_values(self._values), self._flags())
+        ]
+        return OptionArray.from_options(values)
+
+    def filter(self, p: Callable[[T], bool], vectorize: bool = False) -> OptionArray[T]:
+        flags = self._flags()
+        keep = _vectorized(p, self._values, flags) if vectorize else None
+        if keep is not None:
+            return OptionArray(
+                self._values, _pack(flags & keep.astype(bool)), self._length
+            )
+        flags = [
+            flag and bool(p(value))
+            for value, flag in zip(_iter_values(self._values), flags)
+        ]
+        return OptionArray(self._values, _pack(flags), self._length)
+
+    def fold(self, default: U, fs: Callable[[T], U], vectorize: bool = False) -> Any:
+        """Return a column with fs applied to every Some and default for Nothing.
+
+        The result is a NumPy array when fs is vectorized, a list otherwise.
+        """
+        flags = self._flags()
+        result = _vectorized(fs, self._values, flags) if vectorize else None
+        if result is not None:
+            return np.where(flags, result, default)
+        return [
+            fs(value) if flag else default
+            for value, flag in zip(_iter_values(self._values), flags)
+        ]
+
+    def get_or_else(self, default: T) -> Any:
+        """Return the values with default for Nothing, like Option.get_or_else.
+
+        The result is a NumPy array for vectorized columns, a list otherwise.
+        """
+        if _is_ndarray(self._values):
+            return np.where(self._flags(), self._values, default)
+        return [
+            value if flag else default
+            for value, flag in zip(_iter_values(self._values), self._flags())
+        ]
+
+    def to_list(self) -> List[Optional[T]]:
+        return [
+            value if flag else None
+            for value, flag in zip(_iter_values(self._values), self._flags())
+        ]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> Option[T]:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("OptionArray index out of range")
+        return Some(_item(self._values, i)) if self._is_valid(i) else Nothing()
+
+    def __iter__(self) -> Iterator[Option[T]]:
+        for value, flag in zip(_iter_values(self._values), self._flags()):
+            yield Some(value) if flag else Nothing()
+
+    def __str__(self) -> str:
+        return f"OptionArray of length {self._length} with {self.null_count} Nothing"
+
+    def __repr__(self) -> str:
+        return f"algae.OptionArray({list(self)})"
+
+    def __eq__(self, other: OptionArray[T]) -> bool:
+        if not isinstance(other, OptionArray):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+
+class EitherArray(Generic[L, R]):
+    """A column of Either values.
+
+    A tag bitmap marks which slots are Right, and the left and right payloads
+    live in two buffers of the column's length, so each side can be processed
+    or split off without creating Left and Right objects.
+    """
+
+    __slots__ = ("_tags", "_lefts", "_rights", "_length")
+
+    def __init__(self, tags: bytes, lefts: Any, rights: Any, length: int):
+        self._tags = tags
+        self._lefts = lefts
+        self._rights = rights
+        self._length = length
+
+    @staticmethod
+    def from_eithers(eithers: Iterable[Either[L, R]]) -> EitherArray[L, R]:
+        eithers = list(eithers)
+        flags = [either._is_right() for either in eithers]
+        values = [either._value for either in eithers]
+        return EitherArray(
+            _pack(flags),
+            _buffer(values, [not flag for flag in flags]),
+            _buffer(values, flags),
+            len(flags),
+        )
+
+    @staticmethod
+    def from_buffers(
+        tags: Any, lefts: Any, rights: Any, length: Optional[int] = None
+    ) -> EitherArray[Any, Any]:
+        """Build a column on top of a tag bitmap and two values buffers.
+
+        They are objects supporting the buffer protocol, laid out as buffers
+        returns them. The values aren't copied, only the bitmap is.
+        """
+        lefts, rights = _from_buffer(lefts), _from_buffer(rights)
+        if len(lefts) != len(rights):
+            raise ValueError("the left and right buffers must have the same length")
+        length = _buffer_length(rights, length)
+        return EitherArray(_bitmap(tags, length), lefts, rights, length)
+
+    def buffers(self) -> Tuple[memoryview, memoryview, memoryview]:
+        """Return the tag bitmap and the left and right buffers, without copying them.
+
+        The bitmap is little-endian, as in Arrow, with the Right slots set,
+        and the values of each buffer in the slots of the other side are
+        undefined. Only numeric columns are stored in buffers, others raise
+        a TypeError.
+        """
+        return memoryview(self._tags), _export(self._lefts), _export(self._rights)
+
+    def _is_vectorized(self) -> bool:
+        return _is_ndarray(self._lefts) or _is_ndarray(self._rights)
+
+    def _flags(self) -> Any:
+        return _unpack(self._tags, self._length, self._is_vectorized())
+
+    def _is_right(self, i: int) -> bool:
+        return bool(self._tags[i >> 3] >> (i & 7) & 1)
+
+    def map(self, f: Callable[[R], T], vectorize: bool = False) -> EitherArray[L, T]:
+        """Apply f to every Right value, like Either.map.
+
+        vectorize works as it does for OptionArray.map.
+        """
+        flags = self._flags()
+        rights = _vectorized(f, self._rights, flags) if vectorize else None
+        if rights is None:
+            flags = list(flags)
+            values = [
+                f(value) if flag else None
+                for value, flag in zip(_iter_values(self._rights), flags)
+            ]
+            rights = _buffer(values, flags)
+        return EitherArray(self._tags, self._lefts, rights, self._length)
+
+    def swap(self) -> EitherArray[R, L]:
+        return EitherArray(
+            _invert(self._tags, self._length), self._rights, self._lefts, self._length
+        )
+
+    def fold(
+        self, fl: Callable[[L], T], fr: Callable[[R], T], vectorize: bool = False
+    ) -> Any:
+        """Return a column with fr applied to every Right and fl to every Left.
+
+        The result is a NumPy array when both functions are vectorized, a list
+        otherwise.
+        """
+        flags = self._flags()
+        rights = _vectorized(fr, self._rights, flags) if vectorize else None
+        lefts = _vectorized(fl, self._lefts, ~flags) if rights is not None else None
+        if lefts is not None:
+            return np.where(flags, rights, lefts)
+        return [
+            fr(right) if flag else fl(left)
+            for left, right, flag in zip(
+                _iter_values(self._lefts), _iter_values(self._rights), flags
+            )
+        ]
+
+    def partition(self) -> Tuple[Any, Any]:
+        """Split the column into its left values and its right values, in order.
+
+        Each side is returned as a buffer of the kind it is stored in: a NumPy
+        array, an ``array.array`` or a list.
+        """
+        flags = self._flags()
+        if _is_ndarray(flags):
+            left_flags = ~flags
+        else:
+            left_flags = [not flag for flag in flags]
+        return _compress(self._lefts, left_flags), _compress(self._rights, flags)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> Either[L, R]:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("EitherArray index out of range")
+        if self._is_right(i):
+            return Right(_item(self._rights, i))
+        return Left(_item(self._lefts, i))
+
+    def __iter__(self) -> Iterator[Either[L, R]]:
+        for left, right, flag in zip(
+            _iter_values(self._lefts), _iter_values(self._rights), self._flags()
+        ):
+            yield Right(right) if flag else Left(left)
+
+    def __str__(self) -> str:
+        rights = sum(self._tags.translate(_POPCOUNT))
+        return f"EitherArray of length {self._length} with {rights} Right"
+
+    def __repr__(self) -> str:
+        return f"algae.EitherArray({list(self)})"
+
+    def __eq__(self, other: EitherArray[L, R]) -> bool:
+        if not isinstance(other, EitherArray):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+
+class TryBatch(Generic[T]):
+    """The outcome of applying a function to every element of an iterable.
+
+    Results and raised exceptions are stored in two separate columns, each
+    along with the input indices they come from, so no Success or Failure
+    object is created unless one is asked for.
+    """
+
+    __slots__ = (
+        "_success_indices",
+        "_successes",
+        "_failure_indices",
+        "_failures",
+        "_length",
+    )
+
+    def __init__(
+        self,
+        success_indices: array,
+        successes: Any,
+        failure_indices: array,
+        failures: List[Exception],
+        length: int,
+    ):
+        self._success_indices = success_indices
+        self._successes = successes
+        self._failure_indices = failure_indices
+        self._failures = failures
+        self._length = length
+
+    @staticmethod
+    def apply(f: Callable[[Any], T], values: Iterable[Any]) -> TryBatch[T]:
+        """Call f on every value, capturing exceptions as Try.apply does.
+
+        Results that are all ints, or all floats, are packed in a numeric
+        buffer; any other results are kept exactly as f returned them.
+        """
+        success_indices = array("q")
+        successes: List[Any] = []
+        failure_indices = array("q")
+        failures: List[Exception] = []
+        add_success_index, add_success = success_indices.append, successes.append
+        add_failure_index, add_failure = failure_indices.append, failures.append
+        length = 0
+        for length, value in enumerate(values, 1):
+            try:
+                result = f(value)
+            except Exception as e:
+                add_failure_index(length - 1)
+                add_failure(e)
+            else:
+                add_success_index(length - 1)
+                add_success(result)
+        return TryBatch(
+            success_indices,
+            _buffer(successes, [True] * len(successes)),
+            failure_indices,
+            failures,
+            length,
+        )
+
+    @property
+    def successes(self) -> Any:
+        """The successful results, in input order."""
+        return self._successes
+
+    @property
+    def success_indices(self) -> array:
+        return self._success_indices
+
+    @property
+    def failures(self) -> List[Exception]:
+        """The raised exceptions, in input order."""
+        return self._failures
+
+    @property
+    def failure_indices(self) -> array:
+        return self._failure_indices
+
+    def exception_summary(self) -> Dict[Type[Exception], int]:
+        """Count the failures by exception type."""
+        return dict(Counter(map(type, self._failures)))
+
+    def to_tries(self) -> List[Try[T]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> Try[T]:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("TryBatch index out of range")
+        position = bisect_left(self._success_indices, i)
+        if (
+            position < len(self._success_indices)
+            and self._success_indices[position] == i
+        ):
+            return Success(_item(self._successes, position))
+        return Failure(self._failures[bisect_left(self._failure_indices, i)])
+
+    def __iter__(self) -> Iterator[Try[T]]:
+        successes = _iter_values(self._successes)
+        failures = iter(self._failures)
+        failure_indices = iter(self._failure_indices)
+        next_failure = next(failure_indices, self._length)
+        for i in range(self._length):
+            if i == next_failure:
+                yield Failure(next(failures))
+                next_failure = next(failure_indices, self._length)
+            else:
+                yield Success(next(successes))
+
+    def __str__(self) -> str:
+        return f"TryBatch of length {self._length} with {len(self._failures)} Failure"
+
+    def __repr__(self) -> str:
+        return f"algae.TryBatch({list(self)})"
+
+
+def _failing_rows(
+    predicate: Callable[[Any], bool], values: Any, vectorize: bool
+) -> Iterable[int]:
+    """Return the indices of the values that don't satisfy predicate.
+
+    Values for which predicate raises don't satisfy it.
+    """
+    passed = _vectorized(predicate, values) if vectorize else None
+    if passed is not None and passed.dtype.kind == "b":
+        return np.flatnonzero(~passed).tolist()
+    failing = []
+    for i, value in enumerate(_iter_values(values)):
+        try:
+            if not predicate(value):
+                failing.append(i)
+        except Exception:
+            failing.append(i)
+    return failing
+
+
+class ValidatedBatch(Generic[E]):
+    """The outcome of validating a set of records stored as columns.
+
+    Every rule is checked against a whole column at once, and the errors are
+    collected per row, so each record gets all its errors from a single pass
+    without creating a Validated per rule. Numeric columns can be checked
+    with one NumPy call per rule, as OptionArray.map can.
+    """
+
+    __slots__ = ("_columns", "_errors", "_length")
+
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        errors: Dict[int, List[E]],
+        length: int,
+    ):
+        self._columns = columns
+        self._errors = errors
+        self._length = length
+
+    @staticmethod
+    def validate(
+        columns: Mapping[str, Sequence[Any]],
+        rules: Mapping[str, Iterable[Tuple[Callable[[Any], bool], E]]],
+        vectorize: bool = False,
+    ) -> ValidatedBatch[E]:
+        """Check each column against its rules, pairs of a predicate and an error.
+
+        The errors of a row are ordered as the rules are, column by column,
+        and Valid rows hold the values of the columns as they were given.
+        With vectorize set, each predicate is first called with a NumPy array
+        of a numeric column, and NumPy semantics apply, see OptionArray.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns must have the same length")
+        length = lengths.pop() if lengths else 0
+        columns = {
+            name: column
+            if _is_ndarray(column) or isinstance(column, array)
+            else list(column)
+            for name, column in columns.items()
+        }
+        errors: Dict[int, List[E]] = {}
+        for name, column_rules in rules.items():
+            values = columns[name]
+            if vectorize and np is not None and not _is_ndarray(values):
+                values = (
+                    _buffer(values, [True] * length)
+                    if isinstance(values, list)
+                    else _from_buffer(values)
+                )
+            for predicate, error in column_rules:
+                for i in _failing_rows(predicate, values, vectorize):
+                    errors.setdefault(i, []).append(error)
+        return ValidatedBatch(columns, dict(sorted(errors.items())), length)
+
+    @property
+    def errors(self) -> Dict[int, List[E]]:
+        """The errors of every invalid row, by row index in increasing order."""
+        return self._errors
+
+    @property
+    def invalid_indices(self) -> array:
+        return array("q", self._errors)
+
+    @property
+    def valid_indices(self) -> array:
+        errors = self._errors
+        return array("q", (i for i in range(self._length) if i not in errors))
+
+    def error_summary(self) -> Dict[E, int]:
+        """Count how many rows fail each rule, by error."""
+        return dict(Counter(chain.from_iterable(self._errors.values())))
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        return {name: _item(values, i) for name, values in self._columns.items()}
+
+    def to_validated(self) -> List[Validated[E, Dict[str, Any]]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> Validated[E, Dict[str, Any]]:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("ValidatedBatch index out of range")
+        errors = self._errors.get(i)
+        return Invalid(*errors) if errors else Valid(self._row(i))
+
+    def __iter__(self) -> Iterator[Validated[E, Dict[str, Any]]]:
+        for i in range(self._length):
+            yield self[i]
+
+    def __str__(self) -> str:
+        return (
+            f"ValidatedBatch of length {self._length} with {len(self._errors)} Invalid"
+        )
+
+    def __repr__(self) -> str:
+        return f"algae.ValidatedBatch({list(self)})"
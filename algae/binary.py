@@ -0,0 +1,93 @@
+"""Compact binary encoding of sequences of Option, Either and Try values.
+
+An encoded sequence is a header with the number of values, one tag byte per
+value, and all the payloads pickled together as a single list, so that the
+per value overhead is a byte rather than a pickled object. A Failure is
+encoded as its exception type and args, as when it's pickled.
+"""
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, Iterable, List, Union
+
+from algae.either import Either, Left, Right
+from algae.option import Nothing, Option, Some
+from algae.try_ import Failure, Success, Try, _exception_state, _failure_from_state
+
+Value = Union[Option[Any], Either[Any, Any], Try[Any]]
+
+_MAGIC = b"ALG\x01"
+_HEADER = struct.Struct("<4sQ")
+
+_NOTHING_TAG, _SOME, _LEFT, _RIGHT, _FAILURE, _SUCCESS = range(6)
+_TAGS = {
+    Nothing: _NOTHING_TAG,
+    Some: _SOME,
+    Left: _LEFT,
+    Right: _RIGHT,
+    Failure: _FAILURE,
+    Success: _SUCCESS,
+}
+
+
+class DecodeError(Exception):
+    pass
+
+
+def dumps(values: Iterable[Value]) -> bytes:
+    tags = bytearray()
+    payloads: List[Any] = []
+    add_tag, add_payload = tags.append, payloads.append
+    for value in values:
+        try:
+            tag = _TAGS[type(value)]
+        except KeyError:
+            raise TypeError(f"cannot encode {type(value).__name__}") from None
+        add_tag(tag)
+        if tag == _FAILURE:
+            add_payload(_exception_state(value._value))
+        elif tag != _NOTHING_TAG:
+            add_payload(value._value)
+    return (
+        _HEADER.pack(_MAGIC, len(tags))
+        + tags
+        + pickle.dumps(payloads, pickle.HIGHEST_PROTOCOL)
+    )
+
+
+def loads(data: bytes) -> List[Value]:
+    try:
+        magic, length = _HEADER.unpack_from(data)
+    except struct.error:
+        raise DecodeError("data is too short") from None
+    if magic != _MAGIC:
+        raise DecodeError("data wasn't encoded by algae.binary")
+    start = _HEADER.size
+    tags = data[start : start + length]
+    if len(tags) < length:
+        raise DecodeError("data is truncated")
+    payloads = iter(pickle.loads(data[start + length :]))
+    values: List[Value] = []
+    add = values.append
+    try:
+        for tag in tags:
+            if tag == _NOTHING_TAG:
+                add(Nothing())
+            elif tag == _SOME:
+                add(Some(next(payloads)))
+            elif tag == _RIGHT:
+                add(Right(next(payloads)))
+            elif tag == _LEFT:
+                add(Left(next(payloads)))
+            elif tag == _SUCCESS:
+                add(Success(next(payloads)))
+            elif tag == _FAILURE:
+                add(_failure_from_state(*next(payloads)))
+            else:
+                raise DecodeError(f"unknown tag {tag}")
+    except StopIteration:
+        raise DecodeError("there are fewer payloads than values") from None
+    for _ in payloads:
+        raise DecodeError("there are more payloads than values")
+    return values
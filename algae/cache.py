@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+import types
+from collections import OrderedDict
+from functools import update_wrapper
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+from algae.try_ import Try
+
+T = TypeVar("T")
+
+_NEVER = float("inf")
+_KWARGS = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    successes: int
+    failures: int
+
+
+class _LruStore:
+    """An LRU mapping from keys to results with an optional time to live."""
+
+    __slots__ = ("entries", "maxsize", "ttl")
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float]):
+        self.entries: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+
+class _TryLruCacheWrapper:
+    def __init__(
+        self,
+        f: Callable[..., T],
+        maxsize: Optional[int],
+        ttl: Optional[float],
+        failure_maxsize: Optional[int],
+        failure_ttl: Optional[float],
+        timer: Callable[[], float],
+    ):
+        self._f = f
+        self._successes = _LruStore(maxsize, ttl)
+        self._failures = _LruStore(failure_maxsize, failure_ttl)
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        update_wrapper(self, f)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Try[T]:
+        key = (*args, _KWARGS, *sorted(kwargs.items())) if kwargs else args
+        with self._lock:
+            now = self._timer()
+            for store in (self._successes, self._failures):
+                entry = store.entries.get(key)
+                if entry is None:
+                    continue
+                if entry[1] > now:
+                    store.entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del store.entries[key]
+                self._expirations += 1
+            self._misses += 1
+        result = Try.apply(self._f, *args, **kwargs)
+        if result._is_failure():
+            store, other = self._failures, self._successes
+        else:
+            store, other = self._successes, self._failures
+        if store.maxsize == 0:
+            return result
+        with self._lock:
+            other.entries.pop(key, None)
+            expires = self._timer() + store.ttl if store.ttl is not None else _NEVER
+            store.entries[key] = (result, expires)
+            store.entries.move_to_end(key)
+            while store.maxsize is not None and len(store.entries) > store.maxsize:
+                store.entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        # bind to instances like a function, so that methods can be decorated
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                len(self._successes.entries),
+                len(self._failures.entries),
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._successes.entries.clear()
+            self._failures.entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+def try_lru_cache(
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    failure_maxsize: Optional[int] = 128,
+    failure_ttl: Optional[float] = 60.0,
+    timer: Callable[[], float] = time.monotonic,
+) -> Callable[[Callable[..., T]], Callable[..., Try[T]]]:
+    """Memoize the outcomes of a function as Success and Failure.
+
+    The decorated function returns what Try.apply would, and caches it by
+    arguments, like functools.lru_cache. Successes and failures are kept in
+    two separate least recently used caches, each with its own maximum size
+    and time to live in seconds, so that calls that just failed aren't
+    repeated while the failure is cached. A size of None means unbounded, a
+    size of 0 disables caching, and a time to live of None never expires.
+
+    Access is thread-safe, the function itself is called outside the lock,
+    and statistics are returned by the ``cache_info`` method of the
+    decorated function, the caches are emptied by its ``cache_clear``.
+    Methods can be decorated too, with the instance as part of the key, as
+    with functools.lru_cache.
+    """
+
+    def decorator(f: Callable[..., T]) -> Callable[..., Try[T]]:
+        return _TryLruCacheWrapper(f, maxsize, ttl, failure_maxsize, failure_ttl, timer)
+
+    return decorator
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple, TypeVar
+
+from algae.try_ import Failure, Try
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """The exception held by the Failure returned while a circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast around calls to a dependency that keeps failing.
+
+    The outcomes of the last ``window`` calls are tracked and, once at least
+    ``min_calls`` of them are known and the share of failures among them
+    reaches ``failure_rate``, the circuit opens: calls return a Failure
+    holding a CircuitOpenError right away, without calling the function.
+    After ``reset_timeout`` seconds the circuit is half-open and lets
+    ``half_open_calls`` probe calls through: it closes again if they all
+    succeed, and opens again as soon as one of them fails. Only the probes
+    decide whether it closes: a call that was let through before the circuit
+    opened, or before it closed again, doesn't count when it completes.
+
+    The state is guarded by a lock that is never held while calling the
+    function, so a breaker can be shared by threads and by coroutines.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name: str = "",
+        window: int = 20,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if window < 1 or not 1 <= min_calls <= window or half_open_calls < 1:
+            raise ValueError(
+                "window, min_calls and half_open_calls must be positive, "
+                "and min_calls must not exceed window"
+            )
+        self.name = name
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._half_open_calls = half_open_calls
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self._state = CircuitBreaker.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # counts the state changes, so that late results can be told apart
+        self._cycle = 0
+        self._open_failure = Failure(
+            CircuitOpenError(f"circuit {name!r} is open" if name else "circuit is open")
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == CircuitBreaker.OPEN
+                and self._timer() - self._opened_at >= self._reset_timeout
+            ):
+                return CircuitBreaker.HALF_OPEN
+            return self._state
+
+    def apply(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try[T]:
+        """Call f as Try.apply would, unless the circuit is open."""
+        ticket = self._acquire()
+        if ticket is None:
+            return self._open_failure
+        success = False
+        try:
+            result = Try.apply(f, *args, **kwargs)
+            success = not result._is_failure()
+        finally:
+            # a call interrupted by a BaseException, such as a cancelled task,
+            # counts as a failure, so that a half-open probe gives its slot back
+            self._record(ticket, success)
+        return result
+
+    async def apply_async(
+        self, f: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> Try[T]:
+        """Await f as Try.apply_async would, unless the circuit is open."""
+        ticket = self._acquire()
+        if ticket is None:
+            return self._open_failure
+        success = False
+        try:
+            result = await Try.apply_async(f, *args, **kwargs)
+            success = not result._is_failure()
+        finally:
+            # a call interrupted by a BaseException, such as a cancelled task,
+            # counts as a failure, so that a half-open probe gives its slot back
+            self._record(ticket, success)
+        return result
+
+    def _acquire(self) -> Optional[Tuple[int, bool]]:
+        """Admit a call, returning the cycle it belongs to and whether it's a probe.
+
+        None is returned when the call isn't admitted.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.CLOSED:
+                return self._cycle, False
+            if self._state == CircuitBreaker.OPEN:
+                if self._timer() - self._opened_at < self._reset_timeout:
+                    return None
+                self._state = CircuitBreaker.HALF_OPEN
+                self._probes = self._probe_successes = 0
+            if self._probes >= self._half_open_calls:
+                return None
+            self._probes += 1
+            return self._cycle, True
+
+    def _record(self, ticket: Tuple[int, bool], success: bool) -> None:
+        cycle, probe = ticket
+        with self._lock:
+            if cycle != self._cycle:
+                # the call was admitted before the circuit last opened or closed
+                return
+            if probe:
+                if not success:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self._half_open_calls:
+                        self._close()
+            else:
+                if len(self._outcomes) == self._outcomes.maxlen:
+                    self._failures -= not self._outcomes[0]
+                self._outcomes.append(success)
+                self._failures += not success
+                calls = len(self._outcomes)
+                if (
+                    calls >= self._min_calls
+                    and self._failures >= self._failure_rate * calls
+                ):
+                    self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitBreaker.OPEN
+        self._opened_at = self._timer()
+        self._cycle += 1
+
+    def _close(self) -> None:
+        self._state = CircuitBreaker.CLOSED
+        self._cycle += 1
+        self._outcomes.clear()
+        self._failures = 0
+
+    def __repr__(self) -> str:
+        return f"algae.CircuitBreaker({self.name!r}, state={self.state!r})"
+
+
+def circuit_breaker(**options: Any) -> Callable[[Callable[..., T]], Callable[..., Any]]:
+    """Guard every call of the decorated function with its own CircuitBreaker.
+
+    The decorated function returns a Try, or an awaitable Try for coroutine
+    functions, and exposes the breaker as its ``breaker`` attribute. The
+    options are those of CircuitBreaker, whose name defaults to the
+    qualified name of the function.
+    """
+
+    def decorator(f: Callable[..., T]) -> Callable[..., Any]:
+        breaker = CircuitBreaker(**{"name": f.__qualname__, **options})
+        if inspect.iscoroutinefunction(f):
+
+            @wraps(f)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Try[T]:
+                return await breaker.apply_async(f, *args, **kwargs)
+
+            async_wrapper.breaker = breaker
+            return async_wrapper
+
+        @wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Try[T]:
+            return breaker.apply(f, *args, **kwargs)
+
+        wrapper.breaker = breaker
+        return wrapper
+
+    return decorator
@@ -1,38 +1,81 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Callable, Generic, TypeVar, Union
-
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+A = TypeVar("A")
+B = TypeVar("B")
 L = TypeVar("L")
 R = TypeVar("R")
 T = TypeVar("T")
 
 
-class Either(ABC, Generic[L, R]):
+class Either(Generic[L, R]):
 
     _value: Union[L, R]
-    __match_args__ = "_value"
-    __slots__ = "_value"
-
-    def __init__(self, value: Union[L, R]):
-        super().__init__()
-        self._value = value
-
-    def map(self, f: Callable[[R], T]) -> Either[L, T]:
-        return Right(f(self._value)) if self._is_right() else self
-
-    def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
-        return f(self._value) if self._is_right() else self
-
-    def fold(self, fl: Callable[[L], T], fr: Callable[[R], T]) -> T:
-        return fr(self._value) if self._is_right() else fl(self._value)
-
-    def swap(self) -> Either[R, L]:
-        return Left(self._value) if self._is_right() else Right(self._value)
-
-    @abstractmethod
-    def _is_right(self) -> bool:
-        pass
+    __match_args__ = ("_value",)
+    __slots__ = ("_value", "_hash")
+
+    def __init__(self, *args: Any):
+        raise TypeError("Either can't be instantiated, use Left or Right")
+
+    @staticmethod
+    def tail_rec_m(a: A, f: Callable[[A], Either[L, Either[A, B]]]) -> Either[L, B]:
+        """Run a flat_map based loop iteratively, in constant stack space.
+
+        f is called with a, and then with the content of every Left it returns
+        wrapped in a Right, until it returns either a Left, which is returned,
+        or a Right of a Right, whose content is then returned in a Right.
+        """
+        while True:
+            result = f(a)
+            if result._is_left():
+                return result
+            step = result._value
+            if step._is_right():
+                return Right(step._value)
+            a = step._value
+
+    @staticmethod
+    def sequence(eithers: Iterable[Either[L, R]]) -> Either[L, List[R]]:
+        """Return a Right of the contents of all the eithers, or the first Left.
+
+        The eithers are pulled one at a time, and none is pulled after a Left.
+        """
+        values = []
+        add = values.append
+        for either in eithers:
+            if isinstance(either, Left):
+                return either
+            add(either._value)
+        return Right(values)
+
+    @staticmethod
+    def traverse(
+        f: Callable[[A], Either[L, R]], values: Iterable[A]
+    ) -> Either[L, List[R]]:
+        """Like sequence on the results of f, which isn't called after a Left."""
+        results = []
+        add = results.append
+        for value in values:
+            either = f(value)
+            if isinstance(either, Left):
+                return either
+            add(either._value)
+        return Right(results)
+
+    def lazy(self) -> LazyEither[L, R]:
+        """Start a chain of map and flat_map calls that only runs when forced."""
+        return LazyEither(self)
 
     def _is_left(self) -> bool:
         return not self._is_right()
@@ -43,29 +86,159 @@ class Either(ABC, Generic[L, R]):
     def __repr__(self) -> str:
         return f"algae.Either({self._value.__repr__()})"
 
-    def __eq__(self, other: Either[L, R]) -> bool:
-        if self._is_left():
-            return other._is_left() and self._value == other._value
-        elif other._is_left():
-            return False
-        else:
-            return self._value == other._value
 
-    def __ne__(self, other: Either[L, R]) -> bool:
-        return not self == other
+class Right(Either):
+    __slots__ = ()
 
+    def __init__(self, value: R):
+        self._value = value
 
-class Right(Either):
     def _is_right(self) -> bool:
         return True
 
+    def map(self, f: Callable[[R], T]) -> Either[L, T]:
+        return Right(f(self._value))
+
+    def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
+        return f(self._value)
+
+    async def map_async(self, f: Callable[[R], Awaitable[T]]) -> Either[L, T]:
+        return Right(await f(self._value))
+
+    async def flat_map_async(
+        self, f: Callable[[R], Awaitable[Either[L, T]]]
+    ) -> Either[L, T]:
+        return await f(self._value)
+
+    def fold(self, fl: Callable[[L], T], fr: Callable[[R], T]) -> T:
+        return fr(self._value)
+
+    def swap(self) -> Either[R, L]:
+        return Left(self._value)
+
     def __repr__(self) -> str:
         return f"algae.Right({self._value})"
 
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Right):
+            return self._value == other._value
+        return False if isinstance(other, Either) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Right):
+            return self._value != other._value
+        return True if isinstance(other, Either) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((True, self._value))
+            return self._hash
+
+    def __reduce__(self):
+        return Right, (self._value,)
+
 
 class Left(Either):
+    __slots__ = ()
+
+    def __init__(self, value: L):
+        self._value = value
+
     def _is_right(self) -> bool:
         return False
 
+    def map(self, f: Callable[[R], T]) -> Either[L, T]:
+        return self
+
+    def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
+        return self
+
+    async def map_async(self, f: Callable[[R], Awaitable[T]]) -> Either[L, T]:
+        return self
+
+    async def flat_map_async(
+        self, f: Callable[[R], Awaitable[Either[L, T]]]
+    ) -> Either[L, T]:
+        return self
+
+    def fold(self, fl: Callable[[L], T], fr: Callable[[R], T]) -> T:
+        return fl(self._value)
+
+    def swap(self) -> Either[R, L]:
+        return Right(self._value)
+
     def __repr__(self) -> str:
         return f"algae.Left({self._value})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Left):
+            return self._value == other._value
+        return False if isinstance(other, Either) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Left):
+            return self._value != other._value
+        return True if isinstance(other, Either) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((False, self._value))
+            return self._hash
+
+    def __reduce__(self):
+        return Left, (self._value,)
+
+
+class LazyEither(Generic[L, R]):
+    """A chain of map and flat_map calls on an Either, run only when forced.
+
+    The steps are recorded rather than applied, and forcing the chain with
+    fold or evaluate runs all of them in a single loop, without creating an
+    intermediate Either per step.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(
+        self,
+        source: Either[Any, Any],
+        steps: Tuple[Tuple[bool, Callable[[Any], Any]], ...] = (),
+    ):
+        self._source = source
+        self._steps = steps
+
+    def map(self, f: Callable[[R], T]) -> LazyEither[L, T]:
+        return LazyEither(self._source, self._steps + ((False, f),))
+
+    def flat_map(self, f: Callable[[R], Either[L, T]]) -> LazyEither[L, T]:
+        return LazyEither(self._source, self._steps + ((True, f),))
+
+    def _run(self) -> Tuple[bool, Any]:
+        """Return whether the chain ends in a Right, with its value or the Left."""
+        if self._source._is_left():
+            return False, self._source
+        value = self._source._value
+        for is_flat, f in self._steps:
+            if is_flat:
+                either = f(value)
+                if either._is_left():
+                    return False, either
+                value = either._value
+            else:
+                value = f(value)
+        return True, value
+
+    def evaluate(self) -> Either[L, R]:
+        is_right, result = self._run()
+        return Right(result) if is_right else result
+
+    def fold(self, fl: Callable[[L], T], fr: Callable[[R], T]) -> T:
+        is_right, result = self._run()
+        return fr(result) if is_right else fl(result._value)
+
+    def __repr__(self) -> str:
+        return f"algae.LazyEither({self._source!r}, steps={len(self._steps)})"
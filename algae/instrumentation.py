@@ -0,0 +1,266 @@
+"""Opt-in counters and timings for Option, Either and Try.
+
+While instrumentation is disabled, which is the default, nothing in algae
+refers to this module and the types run their own methods: ``enable``
+replaces some of their methods with counting and timing versions, and
+``disable`` puts the originals back, so there's no cost at all unless it's
+enabled.
+
+When enabled, the registry counts the values created per type and the
+Failures created per exception type. As Nothing is a singleton, the
+Nothing count is the number of times an empty Option is produced: by
+``Nothing()``, which is what decoders and columns call too, and by
+Option.apply, Option.when and to_option on a Failure. Functions passing on
+an existing Nothing, such as flat_map, sequence, traverse and
+LazyOption.evaluate, don't count it again. With ``timing=True``, the functions passed to Try.apply, map and
+flat_map are also timed, and their calls and failures are counted, per
+function: lambdas are told apart by the line they're defined on.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from algae.either import Left, Right
+from algae.option import _NOTHING, Nothing, Option, Some
+from algae.try_ import Failure, Success, Try
+
+
+class CallStats(NamedTuple):
+    calls: int
+    failures: int
+    total_seconds: float
+    max_seconds: float
+
+
+class Snapshot(NamedTuple):
+    counts: Dict[str, int]
+    failures: Dict[str, int]
+    calls: Dict[str, CallStats]
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        """The share of Nothing, Left and Failure among Options, Eithers and Trys."""
+        rates = {}
+        for empty, full in (
+            ("Nothing", "Some"),
+            ("Left", "Right"),
+            ("Failure", "Success"),
+        ):
+            total = self.counts.get(empty, 0) + self.counts.get(full, 0)
+            rates[empty] = self.counts.get(empty, 0) / total if total else 0.0
+        return rates
+
+
+def _function_name(f: Callable[..., Any]) -> str:
+    name = getattr(f, "__qualname__", None) or type(f).__qualname__
+    # methods of builtin types, such as str.strip, only know their class
+    module = getattr(f, "__module__", None) or getattr(
+        getattr(f, "__objclass__", None), "__module__", None
+    )
+    if module:
+        name = f"{module}.{name}"
+    code = getattr(f, "__code__", None)
+    if code is not None and code.co_name == "<lambda>":
+        name = f"{name}:{code.co_firstlineno}"
+    return name
+
+
+class Registry:
+    """The counters and timings collected while instrumentation is enabled."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+        # keyed by code object, so that lambdas recreated on every call share a record
+        self._calls: Dict[Any, List[Any]] = {}
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def count_failure(self, exception: BaseException) -> None:
+        cls = type(exception)
+        with self._lock:
+            self._counts["Failure"] += 1
+            self._failures[f"{cls.__module__}.{cls.__qualname__}"] += 1
+
+    def record_call(self, f: Callable[..., Any], seconds: float, failed: bool) -> None:
+        key = getattr(f, "__code__", f)
+        with self._lock:
+            record = self._calls.get(key)
+            if record is None:
+                record = self._calls[key] = [_function_name(f), 0, 0, 0.0, 0.0]
+            record[1] += 1
+            record[2] += failed
+            record[3] += seconds
+            if seconds > record[4]:
+                record[4] = seconds
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            calls: Dict[str, CallStats] = {}
+            for name, *stats in self._calls.values():
+                previous = calls.get(name)
+                if previous is not None:
+                    # distinct callables sharing a name, such as partials
+                    stats = [
+                        previous.calls + stats[0],
+                        previous.failures + stats[1],
+                        previous.total_seconds + stats[2],
+                        max(previous.max_seconds, stats[3]),
+                    ]
+                calls[name] = CallStats(*stats)
+            return Snapshot(dict(self._counts), dict(self._failures), calls)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._failures.clear()
+            self._calls.clear()
+
+
+registry = Registry()
+
+_originals: List[Tuple[type, str, Any]] = []
+
+
+def _call(f: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    start = time.perf_counter()
+    try:
+        result = f(*args, **kwargs)
+    except BaseException:
+        registry.record_call(f, time.perf_counter() - start, True)
+        raise
+    registry.record_call(f, time.perf_counter() - start, False)
+    return result
+
+
+def _flat_call(f: Callable[..., Any], value: Any) -> Any:
+    start = time.perf_counter()
+    try:
+        result = f(value)
+    except BaseException:
+        registry.record_call(f, time.perf_counter() - start, True)
+        raise
+    failed = result is _NOTHING or isinstance(result, (Left, Failure))
+    registry.record_call(f, time.perf_counter() - start, failed)
+    return result
+
+
+def _counting_methods() -> Dict[Tuple[type, str], Any]:
+    some_init, right_init, left_init = Some.__init__, Right.__init__, Left.__init__
+    success_init, failure_init = Success.__init__, Failure.__init__
+
+    def new_nothing(cls):
+        registry.count("Nothing")
+        return _NOTHING
+
+    def init_some(self, value):
+        registry.count("Some")
+        some_init(self, value)
+
+    def init_right(self, value):
+        registry.count("Right")
+        right_init(self, value)
+
+    def init_left(self, value):
+        registry.count("Left")
+        left_init(self, value)
+
+    def init_success(self, value):
+        registry.count("Success")
+        success_init(self, value)
+
+    def init_failure(self, exception):
+        registry.count_failure(exception)
+        failure_init(self, exception)
+
+    def apply(value):
+        if value is None:
+            registry.count("Nothing")
+            return _NOTHING
+        return Some(value)
+
+    def when(condition, value):
+        if not condition:
+            registry.count("Nothing")
+            return _NOTHING
+        return Some(value)
+
+    def to_option(self):
+        registry.count("Nothing")
+        return _NOTHING
+
+    return {
+        (Some, "__init__"): init_some,
+        (Right, "__init__"): init_right,
+        (Left, "__init__"): init_left,
+        (Success, "__init__"): init_success,
+        (Failure, "__init__"): init_failure,
+        (Nothing, "__new__"): staticmethod(new_nothing),
+        (Option, "apply"): staticmethod(apply),
+        (Option, "when"): staticmethod(when),
+        (Failure, "to_option"): to_option,
+    }
+
+
+def _timing_methods() -> Dict[Tuple[type, str], Any]:
+    def try_apply(f, *args, **kwargs):
+        try:
+            return Success(_call(f, *args, **kwargs))
+        except Exception as e:
+            return Failure(e)
+
+    def some_map(self, f):
+        return Some(_call(f, self._value))
+
+    def right_map(self, f):
+        return Right(_call(f, self._value))
+
+    def success_map(self, f):
+        try:
+            return Success(_call(f, self._value))
+        except Exception as e:
+            return Failure(e)
+
+    def flat_map(self, f):
+        return _flat_call(f, self._value)
+
+    return {
+        (Try, "apply"): staticmethod(try_apply),
+        (Some, "map"): some_map,
+        (Some, "flat_map"): flat_map,
+        (Right, "map"): right_map,
+        (Right, "flat_map"): flat_map,
+        (Success, "map"): success_map,
+        (Success, "flat_map"): flat_map,
+    }
+
+
+def enable(timing: bool = False) -> None:
+    """Start counting values, and timing function calls if timing is set.
+
+    Calling enable again replaces the previous settings, the registry is kept.
+    """
+    disable()
+    methods = _counting_methods()
+    if timing:
+        methods.update(_timing_methods())
+    for (cls, name), method in methods.items():
+        _originals.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, method)
+
+
+def disable() -> None:
+    """Restore the original methods, the registry keeps what it collected."""
+    while _originals:
+        cls, name, original = _originals.pop()
+        setattr(cls, name, original)
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
@@ -0,0 +1,173 @@
+"""Streaming JSON encoding of Option, Either and Try values.
+
+Values are encoded with a stable tagged schema:
+
+* ``Nothing`` is ``null`` and ``Some(x)`` is ``{"some": x}``
+* ``Left(x)`` is ``{"left": x}`` and ``Right(x)`` is ``{"right": x}``
+* ``Success(x)`` is ``{"success": x}`` and ``Failure(e)`` is
+  ``{"failure": {"type": "builtins.ValueError", "args": [...]}}``
+
+Values nested in another value, such as ``Right(Success(1))``, are encoded
+with the same schema, as ``{"right": {"success": 1}}``. Only the outer value
+is decoded though, the nested ones are returned as the JSON objects of the
+schema, as a dict holding one of the tags can't be told apart from them.
+
+Sequences are written and read as JSON Lines, one value per line, so that
+neither side ever holds the whole document in memory. The contents are
+plain JSON, encoded and decoded by the json module.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from functools import partial
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Union
+
+from algae.either import Either, Left, Right
+from algae.option import Nothing, Option, Some
+from algae.try_ import Failure, Success, Try, _exception_state, _failure_from_state
+
+Value = Union[Option[Any], Either[Any, Any], Try[Any]]
+
+_PREFIXES = {
+    Some: '{"some": ',
+    Left: '{"left": ',
+    Right: '{"right": ',
+    Success: '{"success": ',
+}
+_CONSTRUCTORS = {"some": Some, "left": Left, "right": Right, "success": Success}
+_TAGS = {constructor: tag for tag, constructor in _CONSTRUCTORS.items()}
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def _exception_type(name: str) -> type:
+    """Find an exception type by qualified name among the modules already loaded.
+
+    Modules are never imported while decoding, and names that can't be found,
+    or that aren't exception types, are decoded as Exception.
+    """
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        found = sys.modules.get(".".join(parts[:i]))
+        if found is None:
+            continue
+        for part in parts[i:]:
+            found = getattr(found, part, None)
+        if isinstance(found, type) and issubclass(found, BaseException):
+            return found
+        break
+    return Exception
+
+
+def _failure(value: Failure) -> Any:
+    exception_type, args = _exception_state(value._value)
+    name = f"{exception_type.__module__}.{exception_type.__qualname__}"
+    return {"failure": {"type": name, "args": args}}
+
+
+def _default(value: Any, fallback: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Turn values nested in the encoded ones into their JSON objects."""
+    cls = type(value)
+    tag = _TAGS.get(cls)
+    if tag is not None:
+        return {tag: value._value}
+    if cls is Nothing:
+        return None
+    if cls is Failure:
+        return _failure(value)
+    if fallback is not None:
+        return fallback(value)
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def _encoder(**kwargs: Any) -> json.JSONEncoder:
+    if not kwargs:
+        return _ENCODER
+    kwargs["default"] = partial(_default, fallback=kwargs.get("default"))
+    return json.JSONEncoder(**kwargs)
+
+
+def _line_encoder(**kwargs: Any) -> json.JSONEncoder:
+    if kwargs.get("indent") is not None:
+        raise ValueError("JSON Lines can't be indented")
+    if any("\n" in sep or "\r" in sep for sep in kwargs.get("separators") or ()):
+        raise ValueError("JSON Lines separators can't contain line breaks")
+    return _encoder(**kwargs)
+
+
+def _encode(value: Value, encode: Any) -> str:
+    cls = type(value)
+    prefix = _PREFIXES.get(cls)
+    if prefix is not None:
+        return prefix + encode(value._value) + "}"
+    if cls is Nothing:
+        return "null"
+    if cls is Failure:
+        return encode(_failure(value))
+    raise TypeError(f"cannot encode {cls.__name__}")
+
+
+def _decode(obj: Any) -> Value:
+    if obj is None:
+        return Nothing()
+    if isinstance(obj, dict) and len(obj) == 1:
+        ((tag, content),) = obj.items()
+        constructor = _CONSTRUCTORS.get(tag)
+        if constructor is not None:
+            return constructor(content)
+        if tag == "failure":
+            try:
+                return _failure_from_state(
+                    _exception_type(content["type"]), tuple(content["args"])
+                )
+            except (TypeError, KeyError):
+                pass
+    raise DecodeError(f"not an encoded Option, Either or Try: {obj!r}")
+
+
+def dumps(value: Value, **kwargs: Any) -> str:
+    """Encode a single value, with kwargs passed to json.JSONEncoder."""
+    return _encode(value, _encoder(**kwargs).encode)
+
+
+def loads(s: str, **kwargs: Any) -> Value:
+    """Decode a single value, with kwargs passed to json.JSONDecoder."""
+    return _decode(json.loads(s, **kwargs))
+
+
+def iterencode(values: Iterable[Value], **kwargs: Any) -> Iterator[str]:
+    """Yield the encoded values one line at a time.
+
+    kwargs are passed to json.JSONEncoder, except indent, as every value must
+    fit on a single line.
+    """
+    return _lines(values, _line_encoder(**kwargs).encode)
+
+
+def _lines(values: Iterable[Value], encode: Any) -> Iterator[str]:
+    for value in values:
+        yield _encode(value, encode) + "\n"
+
+
+def iterdecode(lines: Iterable[str], **kwargs: Any) -> Iterator[Value]:
+    """Decode values one line at a time, skipping blank lines."""
+    decode = json.JSONDecoder(**kwargs).decode
+    for line in lines:
+        if line.strip():
+            yield _decode(decode(line))
+
+
+def dump(values: Iterable[Value], fp: IO[str], **kwargs: Any) -> None:
+    """Write values to a text file as JSON Lines, one value at a time."""
+    fp.writelines(iterencode(values, **kwargs))
+
+
+def load(fp: IO[str], **kwargs: Any) -> Iterator[Value]:
+    """Lazily read values from a text file written by dump."""
+    return iterdecode(fp, **kwargs)
+
+
+_ENCODER = json.JSONEncoder(default=_default)
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Callable, Generic, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+)
 
+if TYPE_CHECKING:
+    from algae.either import Either
+
+A = TypeVar("A")
+B = TypeVar("B")
 T = TypeVar("T")
 U = TypeVar("U")
 
@@ -11,42 +25,69 @@ class NoElement(Exception):
     pass
 
 
-class Option(ABC, Generic[T]):
+class Option(Generic[T]):
 
     _value: T
-    __match_args__ = "_value"
-    __slots__ = "_value"
+    __match_args__ = ("_value",)
+    __slots__ = ()
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args: Any):
+        raise TypeError("Option can't be instantiated, use Some or Nothing")
 
     @staticmethod
     def apply(value: T):
-        return Some(value) if value is not None else Nothing()
+        return Some(value) if value is not None else _NOTHING
 
-    @abstractmethod
-    def _is_empty(self) -> bool:
-        pass
+    @staticmethod
+    def tail_rec_m(a: A, f: Callable[[A], Option[Either[A, B]]]) -> Option[B]:
+        """Run a flat_map based loop iteratively, in constant stack space.
 
-    @abstractmethod
-    def get(self) -> T:
-        pass
-
-    def get_or_else(self, default: T) -> T:
-        return default if self._is_empty() else self.get()
+        f is called with a, and then with the content of every Left it returns
+        wrapped in a Some, until it returns either Nothing or a Some of a Right,
+        whose content is then returned in a Some.
+        """
+        while True:
+            result = f(a)
+            if result._is_empty():
+                return result
+            step = result.get()
+            if step._is_right():
+                return Some(step._value)
+            a = step._value
 
     @staticmethod
-    def when(condition: bool, value: T) -> Option[T]:
-        return Some(value) if condition else Nothing()
+    def sequence(options: Iterable[Option[T]]) -> Option[List[T]]:
+        """Return a Some of the contents of all the options, or the first Nothing.
 
-    def map(self, f: Callable[[T], U]) -> Option[U]:
-        return Some(f(self.get())) if not self._is_empty() else self
+        The options are pulled one at a time, and none is pulled after a Nothing.
+        """
+        values = []
+        add = values.append
+        for option in options:
+            if option is _NOTHING:
+                return option
+            add(option._value)
+        return Some(values)
 
-    def flat_map(self, f: Callable[[T], Option[U]]) -> Option[U]:
-        return f(self.get()) if not self._is_empty() else self
+    @staticmethod
+    def traverse(f: Callable[[A], Option[T]], values: Iterable[A]) -> Option[List[T]]:
+        """Like sequence on the results of f, which isn't called after a Nothing."""
+        results = []
+        add = results.append
+        for value in values:
+            option = f(value)
+            if option is _NOTHING:
+                return option
+            add(option._value)
+        return Some(results)
 
-    def fold(self, default: U, fs: Callable[[T], U]) -> U:
-        return default if self._is_empty() else fs(self.get())
+    @staticmethod
+    def when(condition: bool, value: T) -> Option[T]:
+        return Some(value) if condition else _NOTHING
+
+    def lazy(self) -> LazyOption[T]:
+        """Start a chain of map and flat_map calls that only runs when forced."""
+        return LazyOption(self)
 
     def __str__(self) -> str:
 
@@ -59,21 +100,11 @@ class Option(ABC, Generic[T]):
     def __repr__(self) -> str:
         return "algae.Option"
 
-    def __eq__(self, other: Option[T]) -> bool:
-        if self._is_empty():
-            return other._is_empty()
-        elif other._is_empty():
-            return False
-        else:
-            return self.get() == other.get()
-
-    def __ne__(self, other: Option[T]) -> bool:
-        return not self == other
-
 
 class Some(Option[T]):
+    __slots__ = ("_value", "_hash")
+
     def __init__(self, value: T):
-        super().__init__()
         self._value = value
 
     def _is_empty(self) -> bool:
@@ -82,13 +113,72 @@ class Some(Option[T]):
     def get(self) -> T:
         return self._value
 
+    def get_or_else(self, default: T) -> T:
+        return self._value
+
+    def map(self, f: Callable[[T], U]) -> Option[U]:
+        return Some(f(self._value))
+
+    def flat_map(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        return f(self._value)
+
+    def fold(self, default: U, fs: Callable[[T], U]) -> U:
+        return fs(self._value)
+
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> Option[U]:
+        return Some(await f(self._value))
+
+    async def flat_map_async(self, f: Callable[[T], Awaitable[Option[U]]]) -> Option[U]:
+        return await f(self._value)
+
     def __repr__(self) -> str:
         return f"algae.Some({self.get()})"
 
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Some):
+            return self._value == other._value
+        return False if isinstance(other, Option) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Some):
+            return self._value != other._value
+        return True if isinstance(other, Option) else NotImplemented
+
+    def __reduce__(self):
+        return Some, (self._value,)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Some, self._value))
+            return self._hash
+
 
 class Nothing(Option[T]):
-    def __init__(self):
-        super().__init__()
+    """The empty Option.
+
+    Nothing is a process-wide singleton: every ``Nothing()`` call, as well as
+    pickling and copying, returns the same instance, so ``x is Nothing()``
+    can be used as a fast emptiness test.
+    """
+
+    __match_args__ = ()
+    __slots__ = ()
+    # __new__ returns the singleton, which needs no initialization
+    __init__ = object.__init__
+
+    def __new__(cls) -> Nothing[T]:
+        return _NOTHING
+
+    def __reduce__(self):
+        return Nothing, ()
+
+    def __copy__(self) -> Nothing[T]:
+        return self
+
+    def __deepcopy__(self, memo) -> Nothing[T]:
+        return self
 
     def _is_empty(self) -> bool:
         return True
@@ -96,5 +186,100 @@ class Nothing(Option[T]):
     def get(self) -> T:
         raise NoElement
 
+    def get_or_else(self, default: T) -> T:
+        return default
+
+    def map(self, f: Callable[[T], U]) -> Option[U]:
+        return self
+
+    def flat_map(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        return self
+
+    def fold(self, default: U, fs: Callable[[T], U]) -> U:
+        return default
+
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> Option[U]:
+        return self
+
+    async def flat_map_async(self, f: Callable[[T], Awaitable[Option[U]]]) -> Option[U]:
+        return self
+
     def __repr__(self) -> str:
         return "algae.Nothing"
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        return False if isinstance(other, Option) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if other is self:
+            return False
+        return True if isinstance(other, Option) else NotImplemented
+
+    def __hash__(self) -> int:
+        return _NOTHING_HASH
+
+
+_NOTHING: Nothing = object.__new__(Nothing)
+_NOTHING_HASH = hash((Nothing,))
+
+
+class LazyOption(Generic[T]):
+    """A chain of map and flat_map calls on an Option, run only when forced.
+
+    The steps are recorded rather than applied, and forcing the chain with
+    get, get_or_else, fold or evaluate runs all of them in a single loop,
+    without creating an intermediate Option per step.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(
+        self,
+        source: Option[Any],
+        steps: Tuple[Tuple[bool, Callable[[Any], Any]], ...] = (),
+    ):
+        self._source = source
+        self._steps = steps
+
+    def map(self, f: Callable[[T], U]) -> LazyOption[U]:
+        return LazyOption(self._source, self._steps + ((False, f),))
+
+    def flat_map(self, f: Callable[[T], Option[U]]) -> LazyOption[U]:
+        return LazyOption(self._source, self._steps + ((True, f),))
+
+    def _run(self) -> Tuple[bool, Any]:
+        if self._source._is_empty():
+            return False, None
+        value = self._source.get()
+        for is_flat, f in self._steps:
+            if is_flat:
+                option = f(value)
+                if option._is_empty():
+                    return False, None
+                value = option.get()
+            else:
+                value = f(value)
+        return True, value
+
+    def evaluate(self) -> Option[T]:
+        is_some, value = self._run()
+        return Some(value) if is_some else _NOTHING
+
+    def get(self) -> T:
+        is_some, value = self._run()
+        if not is_some:
+            raise NoElement
+        return value
+
+    def get_or_else(self, default: T) -> T:
+        is_some, value = self._run()
+        return value if is_some else default
+
+    def fold(self, default: U, fs: Callable[[T], U]) -> U:
+        is_some, value = self._run()
+        return fs(value) if is_some else default
+
+    def __repr__(self) -> str:
+        return f"algae.LazyOption({self._source!r}, steps={len(self._steps)})"
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from algae.either import Either, Left, Right
+from algae.try_ import Failure, Success, Try, _exception_state, _failure_from_state
+
+L = TypeVar("L")
+R = TypeVar("R")
+T = TypeVar("T")
+
+_Outcome = Tuple[bool, Any]
+
+
+def _try_chunk(
+    f: Callable[[Any], T], chunk: List[Any], fail_fast: bool
+) -> List[_Outcome]:
+    outcomes = []
+    for value in chunk:
+        try:
+            outcomes.append((True, f(value)))
+        except Exception as e:
+            outcomes.append((False, e))
+            if fail_fast:
+                break
+    return outcomes
+
+
+def _portable_try_chunk(
+    f: Callable[[Any], T], chunk: List[Any], fail_fast: bool
+) -> List[_Outcome]:
+    """Run _try_chunk, returning exceptions as the state Failure pickles them with.
+
+    Exceptions whose __init__ doesn't match their args can't be unpickled, so
+    they're rebuilt from their state, as Failure.__reduce__ does.
+    """
+    return [
+        (ok, value if ok else _exception_state(value))
+        for ok, value in _try_chunk(f, chunk, fail_fast)
+    ]
+
+
+def _either_chunk(
+    f: Callable[[Any], Either[L, R]], chunk: List[Any], fail_fast: bool
+) -> List[_Outcome]:
+    outcomes = []
+    for value in chunk:
+        either = f(value)
+        outcomes.append((either._is_right(), either._value))
+        if fail_fast and either._is_left():
+            break
+    return outcomes
+
+
+def _chunks(iterable: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, chunksize)), [])
+
+
+def _run(
+    run_chunk: Callable[[Callable[[Any], Any], List[Any], bool], List[_Outcome]],
+    f: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    executor: Optional[Executor],
+    processes: bool,
+    max_workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+    fail_fast: bool,
+) -> Iterator[_Outcome]:
+    """Run f over chunks of the iterable on an executor, yielding the outcomes.
+
+    Chunks are submitted lazily, keeping at most two per worker in flight, and
+    outcomes travel back as plain (ok, value) pairs, so that a process pool
+    pickles one list per chunk rather than one wrapper per element. With
+    fail_fast, a chunk stops at its first failure.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    owned = executor is None
+    if owned:
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        executor = pool(max_workers)
+    chunks = _chunks(iterable, chunksize)
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    pending: deque[Future] = deque(
+        executor.submit(run_chunk, f, chunk, fail_fast)
+        for chunk in islice(chunks, window)
+    )
+
+    def refill() -> None:
+        for chunk in islice(chunks, 1):
+            pending.append(executor.submit(run_chunk, f, chunk, fail_fast))
+
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done = wait(pending, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                outcomes = future.result()
+                refill()
+                for outcome in outcomes:
+                    yield outcome
+                    if fail_fast and not outcome[0]:
+                        return
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            # chunks still running when the iteration stops early are left to
+            # finish on their own, rather than holding up the caller
+            executor.shutdown(wait=not pending)
+
+
+def map_try(
+    f: Callable[[Any], T],
+    iterable: Iterable[Any],
+    *,
+    executor: Optional[Executor] = None,
+    processes: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    fail_fast: bool = False,
+) -> Iterator[Try[T]]:
+    """Lazily apply f to every element on a pool, as Try.apply would.
+
+    An executor can be passed in, and is then left running; otherwise a
+    thread pool, or a process pool if ``processes`` is set, is created and
+    shut down once the results are consumed. Results are yielded in input
+    order, or as they complete if ``ordered`` is False. With ``fail_fast``
+    the iteration ends with the first Failure and outstanding work is
+    cancelled. Exceptions raised in other processes are rebuilt from their
+    type and args, as when a Failure is pickled.
+    """
+    # exceptions can only be sent back as they are by threads
+    portable = (
+        processes if executor is None else not isinstance(executor, ThreadPoolExecutor)
+    )
+    for ok, value in _run(
+        _portable_try_chunk if portable else _try_chunk,
+        f,
+        iterable,
+        executor,
+        processes,
+        max_workers,
+        chunksize,
+        ordered,
+        fail_fast,
+    ):
+        if ok:
+            yield Success(value)
+        else:
+            yield _failure_from_state(*value) if portable else Failure(value)
+
+
+def map_either(
+    f: Callable[[Any], Either[L, R]],
+    iterable: Iterable[Any],
+    *,
+    executor: Optional[Executor] = None,
+    processes: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    fail_fast: bool = False,
+) -> Iterator[Either[L, R]]:
+    """Lazily apply f, which returns an Either, to every element on a pool.
+
+    Accepts the same options as map_try, with ``fail_fast`` stopping at the
+    first Left. Exceptions raised by f are not captured.
+    """
+    for is_right, value in _run(
+        _either_chunk,
+        f,
+        iterable,
+        executor,
+        processes,
+        max_workers,
+        chunksize,
+        ordered,
+        fail_fast,
+    ):
+        yield Right(value) if is_right else Left(value)
+
+
+def traverse_try(
+    f: Callable[[Any], T],
+    iterable: Iterable[Any],
+    *,
+    executor: Optional[Executor] = None,
+    processes: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> Try[List[T]]:
+    """Apply f to every element on a pool, collecting the results in a Success.
+
+    The first Failure, in input order, is returned instead, and the work that
+    is still outstanding at that point is cancelled.
+    """
+    results = []
+    for result in map_try(
+        f,
+        iterable,
+        executor=executor,
+        processes=processes,
+        max_workers=max_workers,
+        chunksize=chunksize,
+        fail_fast=True,
+    ):
+        if result._is_failure():
+            return result
+        results.append(result._value)
+    return Success(results)
+
+
+def traverse_either(
+    f: Callable[[Any], Either[L, R]],
+    iterable: Iterable[Any],
+    *,
+    executor: Optional[Executor] = None,
+    processes: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> Either[L, List[R]]:
+    """Apply f to every element on a pool, collecting the values in a Right.
+
+    The first Left, in input order, is returned instead, and the work that is
+    still outstanding at that point is cancelled.
+    """
+    results = []
+    for result in map_either(
+        f,
+        iterable,
+        executor=executor,
+        processes=processes,
+        max_workers=max_workers,
+        chunksize=chunksize,
+        fail_fast=True,
+    ):
+        if result._is_left():
+            return result
+        results.append(result._value)
+    return Right(results)
@@ -0,0 +1,99 @@
+"""Lazy, generator based processing of iterables of Option, Either and Try.
+
+Every function pulls one element at a time from its input and yields its
+results as they are produced, so pipelines built with them run in constant
+memory however large the input, and stop reading it as soon as they stop
+being consumed.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, TypeVar, Union
+
+from algae.either import Either
+from algae.option import _NOTHING, Nothing, Option, Some
+from algae.try_ import Try
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Wrapped = Union[Option[T], Either[Any, T], Try[T]]
+
+
+def _is_ok(value: Wrapped[Any]) -> bool:
+    """Whether value is a Some, a Right or a Success."""
+    if isinstance(value, Try):
+        return not value._is_failure()
+    if isinstance(value, Either):
+        return value._is_right()
+    return not value._is_empty()
+
+
+def apply(f: Callable[[Any], T], values: Iterable[Any]) -> Iterator[Try[T]]:
+    """Wrap the call of f on each raw value with Try.apply."""
+    for value in values:
+        yield Try.apply(f, value)
+
+
+def map(f: Callable[[T], U], values: Iterable[Wrapped[T]]) -> Iterator[Wrapped[U]]:
+    for value in values:
+        yield value.map(f)
+
+
+def flat_map(
+    f: Callable[[T], Wrapped[U]], values: Iterable[Wrapped[T]]
+) -> Iterator[Wrapped[U]]:
+    for value in values:
+        yield value.flat_map(f)
+
+
+def filter_map(f: Callable[[Any], Wrapped[U]], values: Iterable[Any]) -> Iterator[U]:
+    """Call f, which returns an Option, Either or Try, on each raw value.
+
+    The contents of the Some, Right and Success results are yielded, the other
+    results are dropped.
+    """
+    for value in values:
+        result = f(value)
+        if _is_ok(result):
+            yield result._value
+
+
+def collect_successes(values: Iterable[Wrapped[T]]) -> Iterator[T]:
+    """Yield the contents of every Some, Right and Success."""
+    for value in values:
+        if _is_ok(value):
+            yield value._value
+
+
+def collect_failures(values: Iterable[Wrapped[Any]]) -> Iterator[Any]:
+    """Yield the exception of every Failure and the value of every Left.
+
+    Nothing has no content, so it is skipped.
+    """
+    for value in values:
+        if not _is_ok(value) and value is not _NOTHING:
+            yield value._value
+
+
+def take_until_failure(
+    values: Iterable[Wrapped[T]], inclusive: bool = True
+) -> Iterator[Wrapped[T]]:
+    """Yield values until the first Nothing, Left or Failure, then stop.
+
+    The failed value itself is yielded too, unless inclusive is False, and
+    nothing after it is read from the input.
+    """
+    for value in values:
+        if not _is_ok(value):
+            if inclusive:
+                yield value
+            return
+        yield value
+
+
+def first_failure(values: Iterable[Wrapped[T]]) -> Option[Wrapped[T]]:
+    """Return the first Nothing, Left or Failure, reading no further than it."""
+    for value in values:
+        if not _is_ok(value):
+            return Some(value)
+    return Nothing()
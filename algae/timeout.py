@@ -0,0 +1,133 @@
+"""Time-bounded calls returning a Try.
+
+The calls run on a pool of worker threads shared by the whole process and
+reused across calls, while the caller waits for at most the given time and
+then gets a Failure holding a TimeoutError. Python can't interrupt a thread,
+so a call that times out keeps running on its worker until it returns, but
+nobody waits for it: the workers are daemon threads, which don't hold up
+the interpreter's exit either, and the pool starts a new worker whenever
+the others are busy, up to a maximum.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from queue import SimpleQueue
+from typing import Any, Callable, Optional, TypeVar
+
+from algae.try_ import Failure, Success, Try
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_WORKERS = 64
+
+
+class _WorkerPool:
+    """A growing pool of daemon threads running submitted calls."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._queue: SimpleQueue = SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._workers = 0
+
+    def submit(self, f: Callable[..., T], args: Any, kwargs: Any) -> Future:
+        future: Future = Future()
+        self._queue.put((future, f, args, kwargs))
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._workers < self.max_workers:
+                    self._workers += 1
+                    threading.Thread(
+                        target=self._work,
+                        name=f"algae-timeout-{self._workers}",
+                        daemon=True,
+                    ).start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            future, f, args, kwargs = self._queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(f(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            # don't keep the last call alive while idle
+            del future, f, args, kwargs
+            self._idle.release()
+
+
+_pool = _WorkerPool(_DEFAULT_MAX_WORKERS)
+
+
+def set_max_workers(max_workers: int) -> None:
+    """Set how many worker threads the shared pool may run at once."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    _pool.max_workers = max_workers
+
+
+def apply(
+    seconds: Optional[float], f: Callable[..., T], *args: Any, **kwargs: Any
+) -> Try[T]:
+    """Call f as Try.apply would, returning a Failure after seconds.
+
+    The Failure holds a TimeoutError, and seconds None waits without bound.
+    """
+    future = _pool.submit(f, args, kwargs)
+    try:
+        return Success(future.result(seconds))
+    except FutureTimeoutError:
+        if future.done():
+            # f raised a TimeoutError itself, or returned right after the wait
+            return Try.apply(future.result)
+        future.cancel()
+        return Failure(TimeoutError(f"call didn't complete within {seconds} seconds"))
+    except Exception as e:
+        return Failure(e)
+
+
+class Deadline:
+    """A latency budget shared by several calls, such as a flat_map chain.
+
+    Each call made through the deadline is bounded by the time that remains
+    until it expires, and calls made after it expired fail right away:
+
+        deadline = Deadline(0.25)
+        deadline.apply(fetch, url).flat_map(deadline.bound(parse))
+    """
+
+    __slots__ = ("_expires_at", "_timer")
+
+    def __init__(self, seconds: float, timer: Callable[[], float] = time.monotonic):
+        self._timer = timer
+        self._expires_at = timer() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._timer())
+
+    @property
+    def expired(self) -> bool:
+        return self._timer() >= self._expires_at
+
+    def apply(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try[T]:
+        """Call f as Try.apply would, within the time that remains."""
+        remaining = self._expires_at - self._timer()
+        if remaining <= 0:
+            return Failure(TimeoutError("deadline exceeded"))
+        return apply(remaining, f, *args, **kwargs)
+
+    def bound(self, f: Callable[..., T]) -> Callable[..., Try[T]]:
+        """Wrap f so that every call goes through apply, e.g. to pass it to flat_map."""
+
+        def bounded(*args: Any, **kwargs: Any) -> Try[T]:
+            return self.apply(f, *args, **kwargs)
+
+        return bounded
+
+    def __repr__(self) -> str:
+        return f"algae.Deadline(remaining={self.remaining():.3f})"
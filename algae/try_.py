@@ -1,23 +1,87 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any, Callable, Generic, TypeVar, Union
+import sys
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from algae.either import Either, Left, Right
-from algae.option import Nothing, Option, Some
+from algae.option import _NOTHING, Option, Some
 
+A = TypeVar("A")
+B = TypeVar("B")
 T = TypeVar("T")
 U = TypeVar("U")
 
+_lightweight_failures = False
 
-class Try(ABC, Generic[T]):
+
+def set_lightweight_failures(enabled: bool) -> None:
+    """Make every Failure created from now on drop the traceback of its exception.
+
+    A traceback keeps alive every frame of the failing stack, and all their
+    local variables, for as long as the Failure holds the exception. Without
+    it the exception type and args are kept, and the frames can be released.
+    """
+    global _lightweight_failures
+    _lightweight_failures = enabled
+
+
+def _drop_tracebacks(exception: BaseException) -> BaseException:
+    """Drop the traceback of an exception and of the exceptions chained to it."""
+    seen = set()
+    pending = [exception]
+    while pending:
+        current = pending.pop()
+        if current is not None and id(current) not in seen:
+            seen.add(id(current))
+            current.__traceback__ = None
+            pending += (current.__cause__, current.__context__)
+    return exception
+
+
+def _exception_state(exception: BaseException) -> Tuple[Type[BaseException], tuple]:
+    """Return the type and args an exception can be rebuilt from in another process.
+
+    Exception types that can't be imported by name, such as those defined in a
+    function, are replaced by their closest base class that can be.
+    """
+    for cls in type(exception).__mro__:
+        found = sys.modules.get(cls.__module__)
+        for name in cls.__qualname__.split("."):
+            found = getattr(found, name, None)
+        if found is cls:
+            return cls, exception.args
+    return Exception, exception.args
+
+
+def _failure_from_state(exception_type: Type[BaseException], args: tuple) -> Failure:
+    """Rebuild a Failure from the state returned by _exception_state.
+
+    The exception's __init__ isn't called, as its signature may not match args.
+    """
+    exception = exception_type.__new__(exception_type, *args)
+    exception.args = args
+    return Failure(exception)
+
+
+class Try(Generic[T]):
 
     _value: T
-    __match_args__ = "_value"
-    __slots__ = "_value"
+    __match_args__ = ("_value",)
+    __slots__ = ("_value", "_hash")
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args: Any):
+        raise TypeError("Try can't be instantiated, use Success or Failure")
 
     @staticmethod
     def apply(f: Callable[[Any], T], *args: Any, **kwargs: Any) -> Try[T]:
@@ -26,40 +90,89 @@ class Try(ABC, Generic[T]):
         except Exception as e:
             return Failure(e)
 
-    @abstractmethod
-    def _is_failure(self) -> bool:
-        pass
+    @staticmethod
+    def apply_lightweight(f: Callable[[Any], T], *args: Any, **kwargs: Any) -> Try[T]:
+        """Like apply, but a Failure doesn't keep the traceback of its exception.
 
-    def _is_success(self) -> bool:
-        return not self._is_failure()
+        See set_lightweight_failures to enable this for every Failure.
+        """
+        try:
+            return Success(f(*args, **kwargs))
+        except Exception as e:
+            return Failure(_drop_tracebacks(e))
 
-    @abstractmethod
-    def get(self) -> Union[T, Exception]:
-        pass
+    @staticmethod
+    async def apply_async(
+        f: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> Try[T]:
+        try:
+            return Success(await f(*args, **kwargs))
+        except Exception as e:
+            return Failure(e)
 
-    @abstractmethod
-    def get_or_else(self, default: T) -> T:
-        pass
+    @staticmethod
+    def tail_rec_m(a: A, f: Callable[[A], Try[Either[A, B]]]) -> Try[B]:
+        """Run a flat_map based loop iteratively, in constant stack space.
+
+        f is called with a, and then with the content of every Left it returns
+        wrapped in a Success, until it returns either a Failure, which is
+        returned, or a Success of a Right, whose content is then returned in a
+        Success. Exceptions raised by f are returned as a Failure.
+        """
+        try:
+            while True:
+                result = f(a)
+                if result._is_failure():
+                    return result
+                step = result._value
+                if step._is_right():
+                    return Success(step._value)
+                a = step._value
+        except Exception as e:
+            return Failure(e)
 
-    @abstractmethod
-    def map(self, f: Callable[[T], U]) -> Try[U]:
-        pass
+    @staticmethod
+    def sequence(tries: Iterable[Try[T]]) -> Try[List[T]]:
+        """Return a Success of the contents of all the tries, or the first Failure.
+
+        The tries are pulled one at a time, and none is pulled after a Failure.
+        Exceptions raised while pulling them are returned as a Failure.
+        """
+        values = []
+        add = values.append
+        try:
+            for result in tries:
+                if isinstance(result, Failure):
+                    return result
+                add(result._value)
+        except Exception as e:
+            return Failure(e)
+        return Success(values)
 
-    @abstractmethod
-    def flat_map(self, f: Callable[[T], Try[U]]) -> Try[U]:
-        pass
+    @staticmethod
+    def traverse(f: Callable[[A], Try[T]], values: Iterable[A]) -> Try[List[T]]:
+        """Like sequence on the results of f, which isn't called after a Failure.
 
-    @abstractmethod
-    def fold(self, ff: Callable[[Exception], U], fs: Callable[[T], U]) -> U:
-        pass
+        Exceptions raised by f, or while pulling values, are returned as a Failure.
+        """
+        results = []
+        add = results.append
+        try:
+            for value in values:
+                result = f(value)
+                if isinstance(result, Failure):
+                    return result
+                add(result._value)
+        except Exception as e:
+            return Failure(e)
+        return Success(results)
 
-    @abstractmethod
-    def to_either(self) -> Either[Exception, T]:
-        pass
+    def _is_success(self) -> bool:
+        return not self._is_failure()
 
-    @abstractmethod
-    def to_option(self) -> Option[T]:
-        pass
+    def lazy(self) -> LazyTry[T]:
+        """Start a chain of map and flat_map calls that only runs when forced."""
+        return LazyTry(self)
 
     def __str__(self) -> str:
         return f"Try is {'Success' if self._is_success() else 'Failure'}"
@@ -67,17 +180,11 @@ class Try(ABC, Generic[T]):
     def __repr__(self) -> str:
         return "algae.Try"
 
-    @abstractmethod
-    def __eq__(self, other: Try[T]) -> bool:
-        pass
-
-    def __ne__(self, other: Try[T]) -> bool:
-        return not self == other
-
 
 class Success(Try):
+    __slots__ = ()
+
     def __init__(self, value: T):
-        super().__init__()
         self._value = value
 
     def _is_failure(self) -> bool:
@@ -87,25 +194,37 @@ class Success(Try):
         return self._value
 
     def get_or_else(self, default: T) -> T:
-        return self.get()
+        return self._value
 
     def map(self, f: Callable[[T], U]) -> Try[U]:
-        return Try.apply(f, self.get())
+        try:
+            return Success(f(self._value))
+        except Exception as e:
+            return Failure(e)
 
     def flat_map(self, f: Callable[[T], Try[U]]) -> Try[U]:
-        return f(self.get())
+        return f(self._value)
+
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> Try[U]:
+        try:
+            return Success(await f(self._value))
+        except Exception as e:
+            return Failure(e)
+
+    async def flat_map_async(self, f: Callable[[T], Awaitable[Try[U]]]) -> Try[U]:
+        return await f(self._value)
 
     def fold(self, ff: Callable[[Exception], U], fs: Callable[[T], U]) -> U:
         try:
-            return fs(self.get())
+            return fs(self._value)
         except Exception as e:
             return ff(e)
 
     def to_either(self) -> Either[Exception, T]:
-        return Right(self.get())
+        return Right(self._value)
 
     def to_option(self) -> Option[T]:
-        return Some(self.get())
+        return Some(self._value)
 
     def __str__(self) -> str:
         return f"Try is Success with value: {self._value.__repr__()} of type {type(self._value)}"
@@ -113,17 +232,34 @@ class Success(Try):
     def __repr__(self) -> str:
         return f"algae.Success({self._value.__repr__()})"
 
-    def __eq__(self, other: Try[T]) -> bool:
-        if other._is_failure():
-            return False
-        else:
-            return self.get() == other.get()
+    def __reduce__(self):
+        return Success, (self._value,)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Success):
+            return self._value == other._value
+        return False if isinstance(other, Try) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Success):
+            return self._value != other._value
+        return True if isinstance(other, Try) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Success, self._value))
+            return self._hash
 
 
 class Failure(Try):
+    __slots__ = ()
+
     def __init__(self, exception: Exception):
-        super().__init__()
-        self._value = exception
+        self._value = (
+            _drop_tracebacks(exception) if _lightweight_failures else exception
+        )
 
     def _is_failure(self) -> bool:
         return True
@@ -140,6 +276,12 @@ class Failure(Try):
     def flat_map(self, f: Callable[[T], Try[U]]) -> Try[U]:
         return self
 
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> Try[U]:
+        return self
+
+    async def flat_map_async(self, f: Callable[[T], Awaitable[Try[U]]]) -> Try[U]:
+        return self
+
     def fold(self, ff: Callable[[Exception], U], fs: Callable[[T], U]) -> U:
         return ff(self._value)
 
@@ -147,7 +289,7 @@ class Failure(Try):
         return Left(self._value)
 
     def to_option(self) -> Option[T]:
-        return Nothing()
+        return _NOTHING
 
     def __str__(self) -> str:
         return f"Try is Failure with exception type: {type(self._value)} and args {self._value.args}"
@@ -155,11 +297,100 @@ class Failure(Try):
     def __repr__(self) -> str:
         return f"algae.Failure({self._value.__repr__()})"
 
-    def __eq__(self, other: Try[T]) -> bool:
-        if other._is_success():
-            return False
-        else:
+    def __reduce__(self):
+        return _failure_from_state, _exception_state(self._value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Failure):
             return (
                 type(self._value) == type(other._value)
                 and self._value.args == other._value.args
             )
+        return False if isinstance(other, Try) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Failure):
+            return (
+                type(self._value) != type(other._value)
+                or self._value.args != other._value.args
+            )
+        return True if isinstance(other, Try) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Failure, type(self._value), self._value.args))
+            return self._hash
+
+
+class LazyTry(Generic[T]):
+    """A chain of map and flat_map calls on a Try, run only when forced.
+
+    The steps are recorded rather than applied, and forcing the chain with
+    get, get_or_else, fold or evaluate runs all of them in a single loop
+    guarded by a single try statement, without creating an intermediate Try
+    per step. As with Try, exceptions raised by a map step become a Failure,
+    while those raised by a flat_map step are propagated.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(
+        self,
+        source: Try[Any],
+        steps: Tuple[Tuple[bool, Callable[[Any], Any]], ...] = (),
+    ):
+        self._source = source
+        self._steps = steps
+
+    def map(self, f: Callable[[T], U]) -> LazyTry[U]:
+        return LazyTry(self._source, self._steps + ((False, f),))
+
+    def flat_map(self, f: Callable[[T], Try[U]]) -> LazyTry[U]:
+        return LazyTry(self._source, self._steps + ((True, f),))
+
+    def _run(self) -> Tuple[bool, Any]:
+        """Return whether the chain ends in a Success, with its value or the Failure."""
+        if self._source._is_failure():
+            return False, self._source
+        value = self._source._value
+        is_flat = False
+        try:
+            for is_flat, f in self._steps:
+                if is_flat:
+                    result = f(value)
+                    if result._is_failure():
+                        return False, result
+                    value = result._value
+                else:
+                    value = f(value)
+        except Exception as e:
+            if is_flat:
+                raise
+            return False, Failure(e)
+        return True, value
+
+    def evaluate(self) -> Try[T]:
+        is_success, result = self._run()
+        return Success(result) if is_success else result
+
+    def get(self) -> T:
+        is_success, result = self._run()
+        return result if is_success else result.get()
+
+    def get_or_else(self, default: T) -> T:
+        is_success, result = self._run()
+        return result if is_success else default
+
+    def fold(self, ff: Callable[[Exception], U], fs: Callable[[T], U]) -> U:
+        is_success, result = self._run()
+        if not is_success:
+            return ff(result._value)
+        try:
+            return fs(result)
+        except Exception as e:
+            return ff(e)
+
+    def __repr__(self) -> str:
+        return f"algae.LazyTry({self._source!r}, steps={len(self._steps)})"
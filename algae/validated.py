@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Tuple, TypeVar
+
+from algae.either import Either, Left, Right
+
+E = TypeVar("E")
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class Validated(Generic[E, T]):
+    """Either a Valid value or the errors of an Invalid one.
+
+    Unlike an Either, combining several Validated with combine, map_n or
+    validate doesn't stop at the first failure: the errors of every Invalid
+    are collected, in order, in a single pass.
+    """
+
+    _value: Any
+    __match_args__ = ("_value",)
+    __slots__ = ("_value", "_hash")
+
+    def __init__(self, *args: Any):
+        raise TypeError("Validated can't be instantiated, use Valid or Invalid")
+
+    @staticmethod
+    def from_either(either: Either[E, T]) -> Validated[E, T]:
+        """Convert a Right to a Valid, and a Left to an Invalid with a single error."""
+        return Valid(either._value) if either._is_right() else Invalid(either._value)
+
+    @staticmethod
+    def combine(*validateds: Validated[E, Any]) -> Validated[E, Tuple[Any, ...]]:
+        """Return a Valid tuple of all the values, or an Invalid of all the errors."""
+        values = []
+        errors = []
+        for validated in validateds:
+            if isinstance(validated, Invalid):
+                errors += validated._value
+            else:
+                values.append(validated._value)
+        return Invalid(*errors) if errors else Valid(tuple(values))
+
+    @staticmethod
+    def map_n(f: Callable[..., U], *validateds: Validated[E, Any]) -> Validated[E, U]:
+        """Call f with the values of validateds if they're all Valid."""
+        return Validated.combine(*validateds).map(lambda values: f(*values))
+
+    @staticmethod
+    def validate(value: T, *rules: Callable[[T], Validated[E, Any]]) -> Validated[E, T]:
+        """Check value against every rule, returning it if they're all Valid."""
+        errors = []
+        for rule in rules:
+            result = rule(value)
+            if isinstance(result, Invalid):
+                errors += result._value
+        return Invalid(*errors) if errors else Valid(value)
+
+    def __str__(self) -> str:
+        return f"Validated is {'Valid' if self._is_valid() else 'Invalid'}, with value: {self._value.__repr__()}"
+
+    def __repr__(self) -> str:
+        return "algae.Validated"
+
+
+class Valid(Validated):
+    __slots__ = ()
+
+    def __init__(self, value: T):
+        self._value = value
+
+    def _is_valid(self) -> bool:
+        return True
+
+    def get_or_else(self, default: T) -> T:
+        return self._value
+
+    def map(self, f: Callable[[T], U]) -> Validated[E, U]:
+        return Valid(f(self._value))
+
+    def flat_map(self, f: Callable[[T], Validated[E, U]]) -> Validated[E, U]:
+        """Chain a validation that depends on the value, stopping at the first Invalid."""
+        return f(self._value)
+
+    def fold(self, fi: Callable[[Tuple[E, ...]], U], fv: Callable[[T], U]) -> U:
+        return fv(self._value)
+
+    def to_either(self) -> Either[Tuple[E, ...], T]:
+        return Right(self._value)
+
+    def __repr__(self) -> str:
+        return f"algae.Valid({self._value!r})"
+
+    def __reduce__(self):
+        return Valid, (self._value,)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Valid):
+            return self._value == other._value
+        return False if isinstance(other, Validated) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Valid, self._value))
+            return self._hash
+
+
+class Invalid(Validated):
+    __slots__ = ()
+
+    def __init__(self, *errors: E):
+        if not errors:
+            raise ValueError("Invalid needs at least one error")
+        self._value = errors
+
+    def _is_valid(self) -> bool:
+        return False
+
+    def get_or_else(self, default: T) -> T:
+        return default
+
+    def map(self, f: Callable[[T], U]) -> Validated[E, U]:
+        return self
+
+    def flat_map(self, f: Callable[[T], Validated[E, U]]) -> Validated[E, U]:
+        return self
+
+    def fold(self, fi: Callable[[Tuple[E, ...]], U], fv: Callable[[T], U]) -> U:
+        return fi(self._value)
+
+    def to_either(self) -> Either[Tuple[E, ...], T]:
+        return Left(self._value)
+
+    def __repr__(self) -> str:
+        return f"algae.Invalid({', '.join(map(repr, self._value))})"
+
+    def __reduce__(self):
+        return Invalid, self._value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Invalid):
+            return self._value == other._value
+        return False if isinstance(other, Validated) else NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Invalid, self._value))
+            return self._hash
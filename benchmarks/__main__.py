@@ -0,0 +1,56 @@
+"""Run the benchmark suite: ``python -m benchmarks --help``."""
+import argparse
+import json
+import sys
+
+from benchmarks import (
+    _harness,
+    bench_batch,
+    bench_codec,
+    bench_either,
+    bench_option,
+    bench_pipelines,
+    bench_try,
+)
+
+if sys.version_info >= (3, 10):
+    from benchmarks import bench_match  # noqa: F401
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure ops/sec and bytes per instance of the algae types.",
+    )
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks matching")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per timing repeat"
+    )
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="JSON baseline to check for regressions"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change flagged as a regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = _harness.run(args.pattern, args.repeat, args.min_time)
+    if args.save:
+        _harness.save(results, args.save)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = _harness.compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+_SPEED: Dict[str, Callable[[], Callable[[], Any]]] = {}
+_MEMORY: Dict[str, Callable[[], Any]] = {}
+
+
+def speed(name: str):
+    """Register a throughput benchmark.
+
+    The decorated function performs any setup and returns the zero-argument
+    callable to be timed, so setup cost never leaks into the measurement.
+    """
+
+    def register(setup: Callable[[], Callable[[], Any]]):
+        _SPEED[name] = setup
+        return setup
+
+    return register
+
+
+def memory(name: str):
+    """Register a memory benchmark.
+
+    The decorated function is a zero-argument factory building one instance;
+    the harness allocates many of them and reports the bytes per instance.
+    """
+
+    def register(factory: Callable[[], Any]):
+        _MEMORY[name] = factory
+        return factory
+
+    return register
+
+
+def measure_speed(
+    stmt: Callable[[], Any], repeat: int = 5, min_time: float = 0.2
+) -> float:
+    timer = timeit.Timer(stmt)
+    number, elapsed = timer.autorange()
+    number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def measure_memory(factory: Callable[[], Any], count: int = 10_000) -> float:
+    instances: List[Any] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            instances[i] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, Any]:
+    speed_results = {}
+    for name, setup in sorted(_SPEED.items()):
+        if pattern is None or pattern in name:
+            speed_results[name] = measure_speed(setup(), repeat, min_time)
+            print(f"{name:<50} {speed_results[name]:>16,.0f} ops/s")
+    memory_results = {}
+    for name, factory in sorted(_MEMORY.items()):
+        if pattern is None or pattern in name:
+            memory_results[name] = measure_memory(factory)
+            print(f"{name:<50} {memory_results[name]:>16,.1f} bytes")
+    return {
+        "meta": {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "ops_per_sec": speed_results,
+        "bytes_per_instance": memory_results,
+    }
+
+
+def save(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return a description of every benchmark that regressed.
+
+    Throughput regresses when it drops by more than ``threshold`` (a fraction)
+    with respect to the baseline, memory when it grows by more than it.
+    """
+    regressions = []
+    for name, ops in results["ops_per_sec"].items():
+        old = baseline.get("ops_per_sec", {}).get(name)
+        if old and ops < old * (1 - threshold):
+            regressions.append(
+                f"{name}: {ops:,.0f} ops/s vs {old:,.0f} baseline ({ops / old - 1:+.1%})"
+            )
+    for name, size in results["bytes_per_instance"].items():
+        old = baseline.get("bytes_per_instance", {}).get(name)
+        if old and size > old * (1 + threshold):
+            regressions.append(
+                f"{name}: {size:,.1f} bytes vs {old:,.1f} baseline ({size / old - 1:+.1%})"
+            )
+    return regressions
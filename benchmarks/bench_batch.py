@@ -0,0 +1,97 @@
+from algae.batch import EitherArray, OptionArray, TryBatch, ValidatedBatch
+from algae.either import Left, Right
+from algae.option import Option
+from algae.try_ import Try
+from algae.validated import Invalid, Valid, Validated
+from benchmarks._harness import speed
+
+_VALUES = [None if i % 10 == 0 else i for i in range(10_000)]
+
+
+@speed("batch.option_array.map_10k")
+def option_array_map():
+    column = OptionArray.apply(_VALUES)
+    return lambda: column.map(lambda x: x * 2, vectorize=True)
+
+
+@speed("batch.option_list.map_10k")
+def option_list_map():
+    options = [Option.apply(value) for value in _VALUES]
+    return lambda: [option.map(lambda x: x * 2) for option in options]
+
+
+@speed("batch.option_array.fold_10k")
+def option_array_fold():
+    column = OptionArray.apply(_VALUES)
+    return lambda: column.fold(0, lambda x: x + 1, vectorize=True)
+
+
+@speed("batch.option_list.fold_10k")
+def option_list_fold():
+    options = [Option.apply(value) for value in _VALUES]
+    return lambda: [option.fold(0, lambda x: x + 1) for option in options]
+
+
+_EITHERS = [Left("invalid") if i % 10 == 0 else Right(i) for i in range(10_000)]
+
+
+@speed("batch.either_array.partition_10k")
+def either_array_partition():
+    column = EitherArray.from_eithers(_EITHERS)
+    return column.partition
+
+
+@speed("batch.either_list.partition_10k")
+def either_list_partition():
+    def partition():
+        lefts = [either._value for either in _EITHERS if either._is_left()]
+        rights = [either._value for either in _EITHERS if either._is_right()]
+        return lefts, rights
+
+    return partition
+
+
+_RAW = ["x" if i % 10 == 0 else str(i) for i in range(10_000)]
+
+
+@speed("batch.try_batch.apply_10k")
+def try_batch_apply():
+    return lambda: TryBatch.apply(int, _RAW)
+
+
+@speed("batch.try_list.apply_10k")
+def try_list_apply():
+    return lambda: [Try.apply(int, value) for value in _RAW]
+
+
+_LEVELS = list(range(-500, 9_500))
+_LEVEL_RULES = [
+    (lambda x, n=n: x % (n + 2) != 0, f"divisible by {n + 2}") for n in range(20)
+]
+
+
+@speed("batch.validated_batch.validate_10k")
+def validated_batch_validate():
+    columns = {"level": _LEVELS}
+    rules = {"level": _LEVEL_RULES}
+    return lambda: ValidatedBatch.validate(columns, rules, vectorize=True)
+
+
+@speed("batch.validated_rows.validate_10k")
+def validated_rows_validate():
+    rules = [
+        lambda x, p=p, e=e: Valid(x) if p(x) else Invalid(e) for p, e in _LEVEL_RULES
+    ]
+    return lambda: [Validated.validate(level, *rules) for level in _LEVELS]
+
+
+@speed("batch.option_array.from_buffers_10k")
+def option_array_from_buffers():
+    values, validity = OptionArray.apply(_VALUES).buffers()
+    return lambda: OptionArray.from_buffers(values, validity)
+
+
+@speed("batch.option_array.to_list_10k")
+def option_array_to_list():
+    column = OptionArray.apply(_VALUES)
+    return column.to_list
@@ -0,0 +1,38 @@
+"""Serialization of sequences of values, compared with unwrapping them by hand."""
+import io
+import json
+
+from algae import binary, json_codec
+from algae.either import Left, Right
+from benchmarks._harness import speed
+
+_EITHERS = [Left("invalid") if i % 10 == 0 else Right(i) for i in range(10_000)]
+
+
+@speed("codec.json_codec.dump_10k")
+def json_codec_dump():
+    return lambda: json_codec.dump(_EITHERS, io.StringIO())
+
+
+@speed("codec.fold_json_dumps.dump_10k")
+def fold_json_dumps():
+    def dump():
+        fp = io.StringIO()
+        for either in _EITHERS:
+            row = either.fold(lambda e: {"left": e}, lambda v: {"right": v})
+            fp.write(json.dumps(row) + "\n")
+
+    return dump
+
+
+@speed("codec.json_codec.load_10k")
+def json_codec_load():
+    fp = io.StringIO()
+    json_codec.dump(_EITHERS, fp)
+    lines = fp.getvalue().splitlines()
+    return lambda: list(json_codec.iterdecode(lines))
+
+
+@speed("codec.binary.round_trip_10k")
+def binary_round_trip():
+    return lambda: binary.loads(binary.dumps(_EITHERS))
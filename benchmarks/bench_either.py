@@ -0,0 +1,107 @@
+from algae.either import Left, Right
+from benchmarks._harness import memory, speed
+
+
+def inc(x):
+    return x + 1
+
+
+def right_inc(x):
+    return Right(x + 1)
+
+
+@speed("either.right.init")
+def right_init():
+    return lambda: Right(1)
+
+
+@speed("either.left.init")
+def left_init():
+    return lambda: Left(1)
+
+
+@speed("either.map.right")
+def map_right():
+    right = Right(1)
+    return lambda: right.map(inc)
+
+
+@speed("either.map.left")
+def map_left():
+    left = Left(1)
+    return lambda: left.map(inc)
+
+
+@speed("either.flat_map.right")
+def flat_map_right():
+    right = Right(1)
+    return lambda: right.flat_map(right_inc)
+
+
+@speed("either.flat_map.left")
+def flat_map_left():
+    left = Left(1)
+    return lambda: left.flat_map(right_inc)
+
+
+@speed("either.fold.right")
+def fold_right():
+    right = Right(1)
+    return lambda: right.fold(inc, inc)
+
+
+@speed("either.fold.left")
+def fold_left():
+    left = Left(1)
+    return lambda: left.fold(inc, inc)
+
+
+@speed("either.swap.right")
+def swap_right():
+    return Right(1).swap
+
+
+@speed("either.eq.right")
+def eq_right():
+    a, b = Right(1), Right(1)
+    return lambda: a == b
+
+
+@speed("either.eq.left")
+def eq_left():
+    a, b = Left(1), Left(1)
+    return lambda: a == b
+
+
+@speed("either.ne.right_left")
+def ne_right_left():
+    a, b = Right(1), Left(1)
+    return lambda: a != b
+
+
+@speed("either.str.right")
+def str_right():
+    right = Right(1)
+    return lambda: str(right)
+
+
+@speed("either.repr.right")
+def repr_right():
+    right = Right(1)
+    return lambda: repr(right)
+
+
+@memory("either.right")
+def right_instance():
+    return Right(1)
+
+
+@memory("either.left")
+def left_instance():
+    return Left(1)
+
+
+@speed("either.hash.right")
+def hash_right():
+    right = Right(("Pk", 42))
+    return lambda: hash(right)
@@ -0,0 +1,59 @@
+"""Dispatch with match statements, compared with fold. Requires Python 3.10."""
+from algae.either import Left, Right
+from algae.option import Nothing, Some
+from benchmarks._harness import speed
+
+_OPTIONS = [Nothing() if i % 10 == 0 else Some(i) for i in range(1_000)]
+_EITHERS = [Left("invalid") if i % 10 == 0 else Right(i) for i in range(1_000)]
+
+
+@speed("match.option.match_1k")
+def option_match():
+    def dispatch():
+        total = 0
+        for option in _OPTIONS:
+            match option:
+                case Some(x):
+                    total += x
+                case Nothing():
+                    total -= 1
+        return total
+
+    return dispatch
+
+
+@speed("match.option.fold_1k")
+def option_fold():
+    def dispatch():
+        total = 0
+        for option in _OPTIONS:
+            total += option.fold(-1, lambda x: x)
+        return total
+
+    return dispatch
+
+
+@speed("match.either.match_1k")
+def either_match():
+    def dispatch():
+        total = 0
+        for either in _EITHERS:
+            match either:
+                case Right(x):
+                    total += x
+                case Left(_):
+                    total -= 1
+        return total
+
+    return dispatch
+
+
+@speed("match.either.fold_1k")
+def either_fold():
+    def dispatch():
+        total = 0
+        for either in _EITHERS:
+            total += either.fold(lambda e: -1, lambda x: x)
+        return total
+
+    return dispatch
@@ -0,0 +1,129 @@
+from algae.option import Nothing, Option, Some
+from benchmarks._harness import memory, speed
+
+
+def inc(x):
+    return x + 1
+
+
+def some_inc(x):
+    return Some(x + 1)
+
+
+@speed("option.apply.some")
+def apply_some():
+    return lambda: Option.apply(1)
+
+
+@speed("option.apply.nothing")
+def apply_nothing():
+    return lambda: Option.apply(None)
+
+
+@speed("option.when.true")
+def when_true():
+    return lambda: Option.when(True, 1)
+
+
+@speed("option.when.false")
+def when_false():
+    return lambda: Option.when(False, 1)
+
+
+@speed("option.get.some")
+def get_some():
+    return Some(1).get
+
+
+@speed("option.get_or_else.some")
+def get_or_else_some():
+    some = Some(1)
+    return lambda: some.get_or_else(0)
+
+
+@speed("option.get_or_else.nothing")
+def get_or_else_nothing():
+    nothing = Nothing()
+    return lambda: nothing.get_or_else(0)
+
+
+@speed("option.map.some")
+def map_some():
+    some = Some(1)
+    return lambda: some.map(inc)
+
+
+@speed("option.map.nothing")
+def map_nothing():
+    nothing = Nothing()
+    return lambda: nothing.map(inc)
+
+
+@speed("option.flat_map.some")
+def flat_map_some():
+    some = Some(1)
+    return lambda: some.flat_map(some_inc)
+
+
+@speed("option.flat_map.nothing")
+def flat_map_nothing():
+    nothing = Nothing()
+    return lambda: nothing.flat_map(some_inc)
+
+
+@speed("option.fold.some")
+def fold_some():
+    some = Some(1)
+    return lambda: some.fold(0, inc)
+
+
+@speed("option.fold.nothing")
+def fold_nothing():
+    nothing = Nothing()
+    return lambda: nothing.fold(0, inc)
+
+
+@speed("option.eq.some")
+def eq_some():
+    a, b = Some(1), Some(1)
+    return lambda: a == b
+
+
+@speed("option.eq.nothing")
+def eq_nothing():
+    a, b = Nothing(), Nothing()
+    return lambda: a == b
+
+
+@speed("option.ne.some_nothing")
+def ne_some_nothing():
+    a, b = Some(1), Nothing()
+    return lambda: a != b
+
+
+@speed("option.str.some")
+def str_some():
+    some = Some(1)
+    return lambda: str(some)
+
+
+@speed("option.repr.some")
+def repr_some():
+    some = Some(1)
+    return lambda: repr(some)
+
+
+@memory("option.some")
+def some_instance():
+    return Some(1)
+
+
+@memory("option.nothing")
+def nothing_instance():
+    return Nothing()
+
+
+@speed("option.hash.some")
+def hash_some():
+    some = Some(("Pk", 42))
+    return lambda: hash(some)
@@ -0,0 +1,150 @@
+"""Chained pipelines modelled on typical parsing and normalisation code."""
+from algae.either import Left, Right
+from algae.option import Option
+from algae.try_ import Try
+from benchmarks._harness import speed
+
+_ROW = {"id": "42", "name": " Pizza ", "price": "7.5"}
+
+
+def _validate_positive(x):
+    return Right(x) if x > 0 else Left("not positive")
+
+
+@speed("pipeline.option.lookup_chain")
+def option_lookup_chain():
+    row = _ROW
+
+    def pipeline():
+        return (
+            Option.apply(row.get("name"))
+            .map(str.strip)
+            .map(str.lower)
+            .flat_map(lambda s: Option.when(len(s) > 0, s))
+            .fold("", str.title)
+        )
+
+    return pipeline
+
+
+@speed("pipeline.option.miss_chain")
+def option_miss_chain():
+    row = _ROW
+
+    def pipeline():
+        return (
+            Option.apply(row.get("missing"))
+            .map(str.strip)
+            .map(str.lower)
+            .flat_map(lambda s: Option.when(len(s) > 0, s))
+            .fold("", str.title)
+        )
+
+    return pipeline
+
+
+@speed("pipeline.either.validation_chain")
+def either_validation_chain():
+    def pipeline():
+        return (
+            Right(_ROW["price"])
+            .map(float)
+            .flat_map(_validate_positive)
+            .map(lambda x: x * 1.22)
+            .fold(lambda e: -1.0, lambda x: round(x, 2))
+        )
+
+    return pipeline
+
+
+@speed("pipeline.try.parse_chain")
+def try_parse_chain():
+    def pipeline():
+        return (
+            Try.apply(int, _ROW["id"])
+            .map(lambda x: x * 2)
+            .flat_map(lambda x: Try.apply(divmod, x, 5))
+            .map(sum)
+            .to_option()
+            .get_or_else(0)
+        )
+
+    return pipeline
+
+
+@speed("pipeline.try.failing_parse_chain")
+def try_failing_parse_chain():
+    def pipeline():
+        return (
+            Try.apply(int, _ROW["name"])
+            .map(lambda x: x * 2)
+            .flat_map(lambda x: Try.apply(divmod, x, 5))
+            .map(sum)
+            .to_either()
+            .fold(lambda e: 0, lambda x: x)
+        )
+
+    return pipeline
+
+
+@speed("pipeline.try.normalisation_12_steps")
+def try_normalisation_chain():
+    steps = [lambda x: x + 1, lambda x: x * 2] * 6
+
+    def pipeline():
+        t = Try.apply(int, "7")
+        for step in steps:
+            t = t.map(step)
+        return t.get_or_else(0)
+
+    return pipeline
+
+
+@speed("pipeline.try.lazy_normalisation_12_steps")
+def try_lazy_normalisation_chain():
+    steps = [lambda x: x + 1, lambda x: x * 2] * 6
+
+    def pipeline():
+        t = Try.apply(int, "7").lazy()
+        for step in steps:
+            t = t.map(step)
+        return t.get_or_else(0)
+
+    return pipeline
+
+
+@speed("pipeline.option.lazy_lookup_chain")
+def option_lazy_lookup_chain():
+    row = _ROW
+
+    def pipeline():
+        return (
+            Option.apply(row.get("name"))
+            .lazy()
+            .map(str.strip)
+            .map(str.lower)
+            .flat_map(lambda s: Option.when(len(s) > 0, s))
+            .fold("", str.title)
+        )
+
+    return pipeline
+
+
+_TEXTS = ["1", "2", "Pk"] + ["4"] * 100_000
+
+
+@speed("pipeline.try.traverse_fail_early_100k")
+def try_traverse_fail_early():
+    return lambda: Try.traverse(lambda x: Try.apply(int, x), iter(_TEXTS))
+
+
+@speed("pipeline.try.list_scan_fail_early_100k")
+def try_list_scan_fail_early():
+    def pipeline():
+        tries = [Try.apply(int, x) for x in _TEXTS]
+        for t in tries:
+            if t._is_failure():
+                return t
+        return Try.apply(lambda: [t.get() for t in tries])
+
+    return pipeline
@@ -0,0 +1,146 @@
+from algae.try_ import Failure, Success, Try
+from benchmarks._harness import memory, speed
+
+_ERROR = ValueError("boom")
+
+
+def inc(x):
+    return x + 1
+
+
+def fail(x):
+    raise _ERROR
+
+
+def success_inc(x):
+    return Success(x + 1)
+
+
+@speed("try.apply.success")
+def apply_success():
+    return lambda: Try.apply(inc, 1)
+
+
+@speed("try.apply.failure")
+def apply_failure():
+    return lambda: Try.apply(fail, 1)
+
+
+@speed("try.get.success")
+def get_success():
+    return Success(1).get
+
+
+@speed("try.get_or_else.success")
+def get_or_else_success():
+    success = Success(1)
+    return lambda: success.get_or_else(0)
+
+
+@speed("try.get_or_else.failure")
+def get_or_else_failure():
+    failure = Failure(_ERROR)
+    return lambda: failure.get_or_else(0)
+
+
+@speed("try.map.success")
+def map_success():
+    success = Success(1)
+    return lambda: success.map(inc)
+
+
+@speed("try.map.success_to_failure")
+def map_success_to_failure():
+    success = Success(1)
+    return lambda: success.map(fail)
+
+
+@speed("try.map.failure")
+def map_failure():
+    failure = Failure(_ERROR)
+    return lambda: failure.map(inc)
+
+
+@speed("try.flat_map.success")
+def flat_map_success():
+    success = Success(1)
+    return lambda: success.flat_map(success_inc)
+
+
+@speed("try.flat_map.failure")
+def flat_map_failure():
+    failure = Failure(_ERROR)
+    return lambda: failure.flat_map(success_inc)
+
+
+@speed("try.fold.success")
+def fold_success():
+    success = Success(1)
+    return lambda: success.fold(str, inc)
+
+
+@speed("try.fold.failure")
+def fold_failure():
+    failure = Failure(_ERROR)
+    return lambda: failure.fold(str, inc)
+
+
+@speed("try.to_either.success")
+def to_either_success():
+    return Success(1).to_either
+
+
+@speed("try.to_option.success")
+def to_option_success():
+    return Success(1).to_option
+
+
+@speed("try.to_option.failure")
+def to_option_failure():
+    return Failure(_ERROR).to_option
+
+
+@speed("try.eq.success")
+def eq_success():
+    a, b = Success(1), Success(1)
+    return lambda: a == b
+
+
+@speed("try.eq.failure")
+def eq_failure():
+    a, b = Failure(ValueError("boom")), Failure(ValueError("boom"))
+    return lambda: a == b
+
+
+@speed("try.ne.success_failure")
+def ne_success_failure():
+    a, b = Success(1), Failure(_ERROR)
+    return lambda: a != b
+
+
+@speed("try.str.success")
+def str_success():
+    success = Success(1)
+    return lambda: str(success)
+
+
+@speed("try.repr.failure")
+def repr_failure():
+    failure = Failure(_ERROR)
+    return lambda: repr(failure)
+
+
+@memory("try.success")
+def success_instance():
+    return Success(1)
+
+
+@memory("try.failure")
+def failure_instance():
+    return Failure(_ERROR)
+
+
+@speed("try.hash.failure")
+def hash_failure():
+    failure = Failure(_ERROR)
+    return lambda: hash(failure)
@@ -0,0 +1,4 @@
+import sys
+
+# match statements are a syntax error before Python 3.10
+collect_ignore = ["test_match.py"] if sys.version_info < (3, 10) else []
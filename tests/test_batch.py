@@ -0,0 +1,388 @@
+import math
+from array import array
+
+import pytest
+
+import algae.batch
+from algae.batch import EitherArray, OptionArray, TryBatch, ValidatedBatch
+from algae.either import Left, Right
+from algae.option import Nothing, Some
+from algae.try_ import Failure, Success, Try
+from algae.validated import Invalid, Valid, Validated
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(algae.batch, "np", None)
+    return request.param
+
+
+def test_option_array_apply(backend):
+    # GIVEN: a list of values where None marks a missing value
+    values = [1, None, 3]
+    # WHEN: an OptionArray is created with apply
+    column = OptionArray.apply(values)
+    # THEN: it contains the same Options that Option.apply would have created
+    assert list(column) == [Some(1), Nothing(), Some(3)] and column.null_count == 1
+
+
+def test_option_array_from_options(backend):
+    # GIVEN: a list of Options with non numeric values
+    options = [Some("Pk"), Nothing(), Some("Chrmndr")]
+    # WHEN: an OptionArray is created from them
+    column = OptionArray.from_options(options)
+    # THEN: indexing returns the initial Options
+    assert [column[0], column[1], column[-1]] == options and len(column) == 3
+
+
+def test_option_array_numeric_buffer_is_contiguous(backend):
+    # GIVEN: a column of numeric values
+    column = OptionArray.apply([1.5, None, 2.5])
+    # WHEN: its value buffer is inspected
+    # THEN: it is not a list of Python objects
+    assert not isinstance(column._values, list)
+
+
+def test_option_array_mixed_numbers_are_kept_exactly(backend):
+    # GIVEN: ints and floats mixed in a column, with an int too large for a float
+    values = [2**60 + 1, None, 0.5]
+    # WHEN: an OptionArray is created from them
+    column = OptionArray.apply(values)
+    # THEN: every value keeps its type and its exact value
+    assert [type(value) for value in column.to_list()] == [int, type(None), float]
+    assert column.to_list() == values
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_option_array_map(backend, vectorize):
+    # GIVEN: a numeric column and a function that can be vectorized
+    column = OptionArray.apply([1, None, 3])
+    f = lambda x: x * 2
+    # WHEN: the function is applied with map
+    # THEN: it's applied to the Some values only
+    assert column.map(f, vectorize).to_list() == [2, None, 6]
+
+
+def test_option_array_map_scalar_function(backend):
+    # GIVEN: a numeric column and a function that only works on scalars
+    column = OptionArray.apply([1, None, math.e])
+    # WHEN: the function is applied with map
+    # THEN: the result is the same as applying it element by element
+    assert column.map(math.log).to_list() == [0.0, None, 1.0]
+
+
+def test_option_array_map_raises_like_option_map(backend):
+    # GIVEN: a numeric column and a function raising on one of its values
+    column = OptionArray.apply([0, 3])
+    # WHEN: the function is applied with map, vectorized or not
+    # THEN: it raises the same exception as Option.map
+    for vectorize in (False, True):
+        with pytest.raises(ZeroDivisionError):
+            column.map(lambda x: 10 // x, vectorize)
+
+
+def test_option_array_map_keeps_python_integers(backend):
+    # GIVEN: a numeric column whose squares don't fit in 64 bits
+    column = OptionArray.apply([2**40, None])
+    # WHEN: a function is applied with map
+    # THEN: the result is exact, as with Option.map
+    assert column.map(lambda x: x * x).to_list() == [2**80, None]
+
+
+def test_option_array_vectorized_map_skips_nothing(backend):
+    # GIVEN: a numeric column and a function recording what it's called with
+    column = OptionArray.apply([1.0, None, 4.0])
+    seen = []
+
+    def f(x):
+        seen.extend(x.tolist() if hasattr(x, "tolist") else [x])
+        return x + 1
+
+    # WHEN: the function is applied with vectorized map
+    result = column.map(f, vectorize=True)
+    # THEN: it only ever sees the Some values, once each
+    assert result.to_list() == [2.0, None, 5.0] and seen == [1.0, 4.0]
+
+
+def test_option_array_flat_map(backend):
+    # GIVEN: a numeric column and a function returning an Option
+    column = OptionArray.apply([1, None, 4])
+    f = lambda x: Some(x + 1) if x % 2 else Nothing()
+    # WHEN: the function is applied with flat_map
+    # THEN: Some values for which it returns Nothing become Nothing
+    assert column.flat_map(f).to_list() == [2, None, None]
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_option_array_filter(backend, vectorize):
+    # GIVEN: a numeric column and a predicate
+    column = OptionArray.apply([1, None, 3, 4])
+    # WHEN: the column is filtered
+    # THEN: values not satisfying the predicate become Nothing
+    assert column.filter(lambda x: x > 2, vectorize).to_list() == [None, None, 3, 4]
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_option_array_fold(backend, vectorize):
+    # GIVEN: a numeric column, a default value and a function
+    column = OptionArray.apply([1, None, 3])
+    # WHEN: the column is folded
+    # THEN: the function is applied to Some values and the default used for Nothing
+    assert list(column.fold(0, lambda x: x + 1, vectorize)) == [2, 0, 4]
+
+
+def test_option_array_get_or_else(backend):
+    # GIVEN: a numeric column and a default value
+    column = OptionArray.apply([1.5, None, 3.5])
+    # WHEN: get_or_else is called
+    # THEN: Nothing is replaced by the default value
+    assert list(column.get_or_else(-1.0)) == [1.5, -1.0, 3.5]
+
+
+def test_option_array_equals(backend):
+    # GIVEN: two columns built from the same values in different ways
+    column = OptionArray.apply(["Pk", None])
+    other = OptionArray.from_options([Some("Pk"), Nothing()])
+    # WHEN: they are compared
+    # THEN: they are equal, and different from a column with other values
+    assert column == other and column != OptionArray.apply(["Pk", "Pk"])
+
+
+def test_either_array_from_eithers(backend):
+    # GIVEN: a list of Left and Right values
+    eithers = [Right(1), Left("Pk"), Right(3)]
+    # WHEN: an EitherArray is created from them
+    column = EitherArray.from_eithers(eithers)
+    # THEN: iterating and indexing return the initial values
+    assert list(column) == eithers and column[-2] == Left("Pk") and len(column) == 3
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_either_array_map(backend, vectorize):
+    # GIVEN: a column of Left and Right values
+    column = EitherArray.from_eithers([Right(1), Left("Pk"), Right(3)])
+    # WHEN: a function is applied with map
+    # THEN: it's applied to the Right values only
+    assert list(column.map(lambda x: x + 1, vectorize)) == [
+        Right(2),
+        Left("Pk"),
+        Right(4),
+    ]
+
+
+def test_either_array_swap(backend):
+    # GIVEN: a column of Left and Right values, with a length not multiple of 8
+    column = EitherArray.from_eithers([Right(1), Left("Pk"), Right(3)])
+    # WHEN: it's swapped
+    swapped = column.swap()
+    # THEN: every Right becomes Left and vice versa
+    assert list(swapped) == [Left(1), Right("Pk"), Left(3)]
+    assert swapped.swap() == column
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_either_array_fold(backend, vectorize):
+    # GIVEN: a column of Left and Right numeric values
+    column = EitherArray.from_eithers([Right(1), Left(-1), Right(3)])
+    # WHEN: it's folded
+    folded = column.fold(lambda x: -x, lambda x: x * 10, vectorize)
+    # THEN: each function is applied to values of its side
+    assert list(folded) == [10, 1, 30]
+
+
+def test_either_array_partition(backend):
+    # GIVEN: a column of Left and Right values
+    column = EitherArray.from_eithers([Right(1), Left("Pk"), Right(3), Left("Pkch")])
+    # WHEN: it's partitioned
+    lefts, rights = column.partition()
+    # THEN: the left and right values are returned separately, in order
+    assert list(lefts) == ["Pk", "Pkch"] and list(rights) == [1, 3]
+
+
+def test_try_batch_apply(backend):
+    # GIVEN: an unsafe function and inputs for which it might raise
+    values = ["1", "Pk", "3", ""]
+    # WHEN: it's applied to all of them with TryBatch.apply
+    batch = TryBatch.apply(int, values)
+    # THEN: results and exceptions are stored with the index of their input
+    assert list(batch.successes) == [1, 3] and list(batch.success_indices) == [0, 2]
+    assert [e.args for e in batch.failures] == [
+        ValueError("invalid literal for int() with base 10: 'Pk'").args,
+        ValueError("invalid literal for int() with base 10: ''").args,
+    ]
+    assert list(batch.failure_indices) == [1, 3]
+
+
+def test_try_batch_matches_try_apply(backend):
+    # GIVEN: an unsafe function and inputs for which it might raise
+    values = [1, 0, 2, 0, 0]
+    f = lambda x: 10 // x
+    # WHEN: it's applied to all of them with TryBatch.apply
+    batch = TryBatch.apply(f, values)
+    # THEN: iterating and indexing give the same results as Try.apply
+    expected = [Try.apply(f, value) for value in values]
+    assert list(batch) == expected and batch.to_tries() == expected
+    assert [batch[i] for i in range(-len(values), 0)] == expected
+
+
+def test_try_batch_keeps_results_as_returned(backend):
+    # GIVEN: a function returning an int too large for a float, or a float
+    f = lambda x: x if x else 1.5
+    values = [2**60 + 1, 0]
+    # WHEN: it's applied to all the inputs with TryBatch.apply
+    batch = TryBatch.apply(f, values)
+    # THEN: the results are exactly those of Try.apply
+    assert list(batch) == [Try.apply(f, value) for value in values]
+    assert type(batch[0].get()) is int
+
+
+def test_try_batch_exception_summary(backend):
+    # GIVEN: an unsafe function raising different exceptions
+    values = [1, 0, "Pk", 0]
+    f = lambda x: 10 // x
+    # WHEN: it's applied to all the inputs with TryBatch.apply
+    batch = TryBatch.apply(f, values)
+    # THEN: the exception summary counts the failures by type
+    assert batch.exception_summary() == {ZeroDivisionError: 2, TypeError: 1}
+    assert batch[0] == Success(10) and batch[2] == Failure(
+        TypeError("unsupported operand type(s) for //: 'int' and 'str'")
+    )
+
+
+_RULES = {
+    "level": [
+        (lambda x: x > 0, "level too low"),
+        (lambda x: x <= 100, "level too high"),
+    ],
+    "name": [(str.isalpha, "name not alphabetic")],
+}
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_validated_batch_validate(backend, vectorize):
+    # GIVEN: records stored as columns, and rules per column
+    columns = {"level": [25, -1, 150, 5], "name": ["Pkch", "Chrmndr", "Sqrtl2", "4"]}
+    # WHEN: they're validated as a batch
+    batch = ValidatedBatch.validate(columns, _RULES, vectorize)
+    # THEN: every row gets all its errors, in rule order
+    assert batch.errors == {
+        1: ["level too low"],
+        2: ["level too high", "name not alphabetic"],
+        3: ["name not alphabetic"],
+    }
+    assert list(batch.valid_indices) == [0] and list(batch.invalid_indices) == [1, 2, 3]
+    assert batch[0] == Valid({"level": 25, "name": "Pkch"})
+    assert batch.error_summary()["name not alphabetic"] == 2
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_validated_batch_matches_validate(backend, vectorize):
+    # GIVEN: records stored as columns, including one for which a rule raises
+    columns = {"level": [25, -1, 7.5], "name": ["Pkch", None, "Sqrtl"]}
+    # WHEN: they're validated as a batch and one by one
+    batch = ValidatedBatch.validate(columns, _RULES, vectorize)
+
+    def rule(name, predicate, error):
+        def check(row):
+            try:
+                return Valid(row) if predicate(row[name]) else Invalid(error)
+            except Exception:
+                return Invalid(error)
+
+        return check
+
+    rules = [rule(name, *r) for name, column in _RULES.items() for r in column]
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    # THEN: the results are the same
+    assert batch.to_validated() == [Validated.validate(row, *rules) for row in rows]
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_validated_batch_keeps_values(backend, vectorize):
+    # GIVEN: a column of ints, and one mixing ints and floats
+    columns = {"level": [2**60 + 1, 0.5], "count": [3, 4]}
+    rules = {"level": [(lambda x: x > 0, "low")], "count": [(lambda x: x > 0, "none")]}
+    # WHEN: they're validated as a batch
+    batch = ValidatedBatch.validate(columns, rules, vectorize)
+    # THEN: Valid rows hold the values as they were given
+    assert batch.to_validated() == [
+        Valid({"level": 2**60 + 1, "count": 3}),
+        Valid({"level": 0.5, "count": 4}),
+    ]
+    rows = [row.get_or_else(None) for row in batch]
+    assert [type(row["level"]) for row in rows] == [int, float]
+    assert [type(row["count"]) for row in rows] == [int, int]
+
+
+def test_option_array_buffers_round_trip(backend):
+    # GIVEN: a numeric OptionArray
+    column = OptionArray.apply([1, None, 3, None, 5, 6, 7, 8, 9])
+    # WHEN: its buffers are exported and a column is built on top of them
+    values, validity = column.buffers()
+    rebuilt = OptionArray.from_buffers(values, validity)
+    # THEN: the buffers follow the Arrow layout, and the columns are equal
+    assert values.tolist() == [1, 0, 3, 0, 5, 6, 7, 8, 9]
+    assert bytes(validity) == bytes([0b11110101, 0b1])
+    assert rebuilt == column and rebuilt.null_count == 2
+
+
+def test_option_array_from_buffers_shares_memory(backend):
+    # GIVEN: a buffer of values and a validity bitmap with padding bits set
+    values = array("d", [1.5, 2.5, 3.5])
+    # WHEN: a column is built on top of them, and the buffer is then changed
+    column = OptionArray.from_buffers(values, b"\xfd")
+    values[0] = 10.5
+    # THEN: the column sees the change, and the padding bits are ignored
+    assert list(column) == [Some(10.5), Nothing(), Some(3.5)]
+    assert column.null_count == 1
+
+
+def test_either_array_buffers_round_trip(backend):
+    # GIVEN: a numeric EitherArray
+    column = EitherArray.from_eithers([Right(1.5), Left(404), Right(2.5)])
+    # WHEN: its buffers are exported and a column is built on top of them
+    tags, lefts, rights = column.buffers()
+    # THEN: the columns are equal
+    assert bytes(tags) == b"\x05" and rights.tolist() == [1.5, 0, 2.5]
+    assert EitherArray.from_buffers(tags, lefts, rights) == column
+
+
+def test_from_buffers_length_too_long(backend):
+    # GIVEN: buffers holding fewer values than the given length
+    values = array("q", [1, 2])
+    # WHEN: columns are built on top of them
+    # THEN: a ValueError is raised, while a shorter length is accepted
+    with pytest.raises(ValueError):
+        OptionArray.from_buffers(values, b"\x1f", length=5)
+    with pytest.raises(ValueError):
+        EitherArray.from_buffers(b"\x1f", values, values, length=5)
+    assert OptionArray.from_buffers(values, b"\x1f", length=1).to_list() == [1]
+
+
+def test_buffers_of_non_numeric_column(backend):
+    # GIVEN: a column of strings
+    column = OptionArray.apply(["Pk", None])
+    # WHEN: its buffers are exported
+    # THEN: a TypeError is raised, as the values aren't in a buffer
+    with pytest.raises(TypeError):
+        column.buffers()
+
+
+def test_option_array_masked():
+    # GIVEN: a numpy.ma masked array
+    np = pytest.importorskip("numpy")
+    masked = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+    # WHEN: an OptionArray is built from it and converted back
+    column = OptionArray.from_masked(masked)
+    back = column.to_masked()
+    # THEN: masked slots are Nothing, and the data is shared rather than copied
+    assert list(column) == [Some(1), Nothing(), Some(3)]
+    assert np.shares_memory(column.buffers()[0], masked.data)
+    assert np.shares_memory(back.data, masked.data) and back.mask.tolist() == [
+        False,
+        True,
+        False,
+    ]
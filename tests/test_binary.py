@@ -0,0 +1,79 @@
+import pickle
+import threading
+
+import pytest
+
+from algae import binary
+from algae.either import Left, Right
+from algae.option import Nothing, Some
+from algae.try_ import Failure, Success
+
+
+class UnpicklableError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"failed with code {code}")
+        self.lock = threading.Lock()
+
+
+def test_round_trip():
+    # GIVEN: a sequence mixing all the types
+    values = [
+        Some(1),
+        Nothing(),
+        Right("Pk"),
+        Left(["Chrmndr"]),
+        Success({"Pkch": 25}),
+        Failure(ValueError("Sqrtl")),
+    ]
+    # WHEN: it's encoded and decoded
+    decoded = binary.loads(binary.dumps(values))
+    # THEN: the same values are returned, and Nothing is still the singleton
+    assert decoded == values and decoded[1] is Nothing()
+
+
+def test_compact():
+    # GIVEN: many small values
+    values = [Some(i) for i in range(1000)]
+    # WHEN: they're encoded
+    # THEN: the encoding is smaller than pickling the list
+    assert len(binary.dumps(values)) < len(
+        pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+    )
+
+
+def test_unpicklable_exception():
+    # GIVEN: a Failure holding an exception that can't be pickled
+    fail = Failure(UnpicklableError(42))
+    with pytest.raises(TypeError):
+        pickle.dumps(fail._value)
+    # WHEN: it's encoded and decoded
+    decoded = binary.loads(binary.dumps([fail]))
+    # THEN: its exception type and args are kept
+    assert decoded == [fail] and decoded[0].fold(lambda e: e.args, str) == (
+        "failed with code 42",
+    )
+
+
+def test_invalid_data():
+    # GIVEN: data that wasn't encoded by algae.binary, was truncated, or whose
+    # payloads don't match its values
+    header = binary._HEADER.pack(binary._MAGIC, 1) + bytes([binary._SOME])
+    invalid = [
+        b"Pkch",
+        binary.dumps([Some(1), Some(2)])[:13],
+        header + pickle.dumps([]),
+        header + pickle.dumps([1, 2]),
+    ]
+    # WHEN: it's decoded
+    # THEN: a DecodeError is raised
+    for data in invalid:
+        with pytest.raises(binary.DecodeError):
+            binary.loads(data)
+
+
+def test_unsupported_value():
+    # GIVEN: a value that isn't an Option, an Either or a Try
+    # WHEN: it's encoded
+    # THEN: a TypeError is raised
+    with pytest.raises(TypeError):
+        binary.dumps([Some(1), 2])
@@ -0,0 +1,141 @@
+import math
+import threading
+
+from algae.cache import CacheInfo, try_lru_cache
+from algae.try_ import Failure, Success, Try
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting(f):
+    calls = []
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return f(*args, **kwargs)
+
+    return wrapper, calls
+
+
+def test_caches_successes_and_failures():
+    # GIVEN: an unsafe function decorated with try_lru_cache
+    f, calls = counting(math.log)
+    cached = try_lru_cache()(f)
+    # WHEN: it's called twice with the same arguments, that succeed or fail
+    results = [cached(1), cached(1), cached(0), cached(0)]
+    # THEN: the results are those of Try.apply, and the function is only called once per argument
+    assert results == [Success(0.0)] * 2 + [Try.apply(math.log, 0)] * 2
+    assert calls == [(1,), (0,)]
+    assert cached.cache_info() == CacheInfo(
+        hits=2, misses=2, evictions=0, expirations=0, successes=1, failures=1
+    )
+
+
+def test_keyword_arguments():
+    # GIVEN: a function decorated with try_lru_cache
+    f, calls = counting(lambda x, base=10: int(x, base))
+    cached = try_lru_cache()(f)
+    # WHEN: it's called with keyword arguments in a different order
+    # THEN: they hit the same cache entry
+    assert cached("ff", base=16) == cached("ff", base=16) == Success(255)
+    assert len(calls) == 1
+
+
+def test_lru_eviction():
+    # GIVEN: a function decorated with a cache holding two successes
+    f, calls = counting(lambda x: x * 2)
+    cached = try_lru_cache(maxsize=2)(f)
+    # WHEN: three different arguments are used, after refreshing the first one
+    cached(1), cached(2), cached(1), cached(3), cached(1), cached(2)
+    # THEN: the least recently used result is evicted
+    assert calls == [(1,), (2,), (3,), (2,)]
+    assert cached.cache_info().evictions == 2
+
+
+def test_separate_ttls():
+    # GIVEN: a function cached with different times to live for successes and failures
+    timer = FakeTimer()
+    f, calls = counting(lambda x: 10 // x)
+    cached = try_lru_cache(ttl=100, failure_ttl=5, timer=timer)(f)
+    cached(1), cached(0)
+    # WHEN: time passes beyond the failure time to live, but not the success one
+    timer.now = 10
+    cached(1), cached(0)
+    # THEN: only the failure is computed again
+    assert calls == [(1,), (0,), (0,)]
+    assert cached.cache_info().expirations == 1
+
+
+def test_failure_caching_disabled():
+    # GIVEN: a function cached with a failure maximum size of 0
+    f, calls = counting(lambda x: 10 // x)
+    cached = try_lru_cache(failure_maxsize=0)(f)
+    # WHEN: it fails twice with the same arguments
+    results = [cached(0), cached(0)]
+    # THEN: the function is called every time
+    assert all(isinstance(result, Failure) for result in results) and len(calls) == 2
+
+
+def test_cache_clear():
+    # GIVEN: a cached function that has been called
+    cached = try_lru_cache()(lambda x: x)
+    cached(1), cached(1)
+    # WHEN: its cache is cleared
+    cached.cache_clear()
+    # THEN: entries and statistics are reset
+    assert cached.cache_info() == CacheInfo(0, 0, 0, 0, 0, 0)
+
+
+def test_thread_safety():
+    # GIVEN: a cached function with a small cache
+    cached = try_lru_cache(maxsize=8)(lambda x: x * 2)
+
+    # WHEN: it's called concurrently from several threads
+    def run():
+        for i in range(1000):
+            assert cached(i % 16) == Success(i % 16 * 2)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # THEN: statistics account for every call and the size limit holds
+    info = cached.cache_info()
+    assert info.hits + info.misses == 4000 and info.successes <= 8
+
+
+def test_wraps_function():
+    # GIVEN: a documented function
+    def lookup(key):
+        """Look something up."""
+        return key
+
+    # WHEN: it's decorated with try_lru_cache
+    cached = try_lru_cache()(lookup)
+    # THEN: its name and documentation are preserved
+    assert cached.__name__ == "lookup" and cached.__doc__ == "Look something up."
+
+
+def test_decorated_method():
+    # GIVEN: a class with a method decorated with try_lru_cache
+    class Scaler:
+        def __init__(self, factor):
+            self.factor = factor
+
+        @try_lru_cache()
+        def scale(self, x):
+            return self.factor * x
+
+    # WHEN: the method is called on different instances
+    double, triple = Scaler(2), Scaler(3)
+    # THEN: it's bound to each instance, which is part of the cache key
+    assert double.scale(5) == double.scale(5) == Success(10)
+    assert triple.scale(5) == Success(15)
+    assert Scaler.scale.cache_info().hits == 1
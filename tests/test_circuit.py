@@ -0,0 +1,206 @@
+import asyncio
+
+import pytest
+
+from algae.circuit import CircuitBreaker, CircuitOpenError, circuit_breaker
+from algae.try_ import Failure, Success
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Dependency:
+    def __init__(self):
+        self.up = True
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if not self.up:
+            raise ConnectionError("down")
+        return x
+
+
+def test_closed_circuit_calls_through():
+    # GIVEN: a circuit breaker around a working dependency
+    breaker = CircuitBreaker(window=4, min_calls=2)
+    dependency = Dependency()
+    # WHEN: calls go through it
+    results = [breaker.apply(dependency, i) for i in range(5)]
+    # THEN: they're the results of Try.apply, and the circuit stays closed
+    assert results == [Success(i) for i in range(5)]
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_opens_on_failure_rate():
+    # GIVEN: a circuit breaker around a dependency that goes down
+    breaker = CircuitBreaker("db", window=4, failure_rate=0.5, min_calls=4)
+    dependency = Dependency()
+    breaker.apply(dependency, 1), breaker.apply(dependency, 2)
+    dependency.up = False
+    # WHEN: enough calls fail to reach the failure rate
+    results = [breaker.apply(dependency, i) for i in range(4)]
+    # THEN: the circuit opens and following calls fail without calling the dependency
+    assert breaker.state == CircuitBreaker.OPEN and dependency.calls == 4
+    assert results[:2] == [Failure(ConnectionError("down"))] * 2
+    assert results[2:] == [Failure(CircuitOpenError("circuit 'db' is open"))] * 2
+
+
+def test_half_open_probe_success_closes():
+    # GIVEN: an open circuit
+    timer = FakeTimer()
+    breaker = CircuitBreaker(window=2, min_calls=2, reset_timeout=10, timer=timer)
+    dependency = Dependency()
+    dependency.up = False
+    breaker.apply(dependency, 1), breaker.apply(dependency, 2)
+    assert breaker.state == CircuitBreaker.OPEN
+    # WHEN: the reset timeout passes, and a probe call succeeds
+    timer.now = 10
+    dependency.up = True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    result = breaker.apply(dependency, 3)
+    # THEN: the circuit closes again
+    assert result == Success(3) and breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    # GIVEN: an open circuit
+    timer = FakeTimer()
+    breaker = CircuitBreaker(window=2, min_calls=2, reset_timeout=10, timer=timer)
+    dependency = Dependency()
+    dependency.up = False
+    breaker.apply(dependency, 1), breaker.apply(dependency, 2)
+    # WHEN: the reset timeout passes, and a probe call fails
+    timer.now = 10
+    breaker.apply(dependency, 3)
+    # THEN: the circuit opens again for another reset timeout
+    assert breaker.state == CircuitBreaker.OPEN
+    timer.now = 15
+    assert breaker.apply(dependency, 4) == Failure(CircuitOpenError("circuit is open"))
+    assert dependency.calls == 3
+
+
+def test_half_open_limits_probes():
+    # GIVEN: a half-open circuit allowing one probe call at a time
+    timer = FakeTimer()
+    breaker = CircuitBreaker(window=1, min_calls=1, reset_timeout=10, timer=timer)
+    dependency = Dependency()
+    dependency.up = False
+    breaker.apply(dependency, 1)
+    timer.now = 10
+    # WHEN: a second call arrives while the probe is still running
+    second = []
+
+    def probe(x):
+        second.append(breaker.apply(lambda: "second"))
+        return x
+
+    result = breaker.apply(probe, "probe")
+    # THEN: only the probe is let through
+    assert result == Success("probe")
+    assert second == [Failure(CircuitOpenError("circuit is open"))]
+
+
+def test_apply_async():
+    # GIVEN: a circuit breaker around a coroutine function that fails
+    breaker = CircuitBreaker(window=2, min_calls=2)
+
+    async def f():
+        raise ConnectionError("down")
+
+    # WHEN: it's called from asyncio until the circuit opens
+    async def calls():
+        return [await breaker.apply_async(f) for _ in range(3)]
+
+    # THEN: the results are Failures, the last one without calling the function
+    assert asyncio.run(calls())[-1] == Failure(CircuitOpenError("circuit is open"))
+
+
+def test_cancelled_probe_releases_its_slot():
+    # GIVEN: a half-open circuit allowing one probe call
+    timer = FakeTimer()
+    breaker = CircuitBreaker(window=1, min_calls=1, reset_timeout=10, timer=timer)
+    dependency = Dependency()
+    dependency.up = False
+    breaker.apply(dependency, 1)
+    timer.now = 10
+
+    # WHEN: the probe is cancelled by a timeout before it completes
+    async def probe():
+        await asyncio.sleep(1)
+
+    async def call():
+        await asyncio.wait_for(breaker.apply_async(probe), 0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(call())
+    # THEN: it counts as a failure, and a new probe is let through after the reset timeout
+    assert breaker.state == CircuitBreaker.OPEN
+    timer.now = 100
+    dependency.up = True
+    assert breaker.apply(dependency, 2) == Success(2)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_late_result_is_not_a_probe():
+    # GIVEN: a call admitted while the circuit is closed, still running when it opens
+    timer = FakeTimer()
+    breaker = CircuitBreaker(window=2, min_calls=2, reset_timeout=10, timer=timer)
+    dependency = Dependency()
+    dependency.up = False
+
+    async def wait_for(event, fails=False):
+        await event.wait()
+        if fails:
+            raise ConnectionError("down")
+
+    async def calls():
+        late_done, probe_done = asyncio.Event(), asyncio.Event()
+        late = asyncio.ensure_future(breaker.apply_async(wait_for, late_done))
+        await asyncio.sleep(0)
+        breaker.apply(dependency, 1), breaker.apply(dependency, 2)
+        timer.now = 10
+        probe = asyncio.ensure_future(breaker.apply_async(wait_for, probe_done, True))
+        await asyncio.sleep(0)
+        # WHEN: it succeeds while a probe is running, and the probe then fails
+        late_done.set()
+        await late
+        state = breaker.state
+        probe_done.set()
+        await probe
+        return state
+
+    # THEN: only the probe decides the state, and the circuit opens again
+    assert asyncio.run(calls()) == CircuitBreaker.HALF_OPEN
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_decorator():
+    # GIVEN: a function and a coroutine function decorated with circuit_breaker
+    @circuit_breaker(window=2, min_calls=2)
+    def lookup(x):
+        return 10 // x
+
+    @circuit_breaker(window=2, min_calls=2)
+    async def fetch(x):
+        return 10 // x
+
+    # WHEN: they're called
+    # THEN: they return Trys, and each has its own breaker named after it
+    assert lookup(2) == Success(5) and asyncio.run(fetch(5)) == Success(2)
+    assert (
+        lookup.breaker.name.endswith("lookup") and fetch.breaker is not lookup.breaker
+    )
+
+
+def test_invalid_options():
+    # GIVEN: a minimum number of calls larger than the window
+    # WHEN: a circuit breaker is created
+    # THEN: a ValueError is raised
+    with pytest.raises(ValueError):
+        CircuitBreaker(window=5, min_calls=10)
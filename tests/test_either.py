@@ -1,4 +1,10 @@
-from algae.either import Left, Right
+import asyncio
+import pickle
+import sys
+
+import pytest
+
+from algae.either import Either, Left, Right
 
 
 def test_map_right():
@@ -147,3 +153,168 @@ def test_not_equals():
         and l != l2
         and l2 != l
     )
+
+
+class _Slotted:
+    __slots__ = ("_value", "_hash")
+
+    def __init__(self, value):
+        self._value = value
+
+
+def test_instances_have_no_dict():
+    # GIVEN: an instance of Right and an instance of Left
+    instances = (Right(5), Left(5))
+    # WHEN: their attributes are inspected
+    # THEN: none of them carries a __dict__
+    assert all(not hasattr(instance, "__dict__") for instance in instances)
+
+
+def test_instance_size():
+    # GIVEN: an instance of Right and an instance of Left
+    instances = (Right(5), Left(5))
+    # WHEN: their size is compared to a plain Python object with the same slots
+    # THEN: they are not any bigger
+    assert all(
+        sys.getsizeof(instance) == sys.getsizeof(_Slotted(5)) for instance in instances
+    )
+
+
+def test_map_async():
+    # GIVEN: a coroutine function acting on the value
+    async def f(x):
+        await asyncio.sleep(0)
+        return x + 1
+
+    # WHEN: it's applied to Right and Left through map_async
+    async def chain():
+        return [await Right(5).map_async(f), await Left(5).map_async(f)]
+
+    # THEN: only the Right value is mapped
+    assert asyncio.run(chain()) == [Right(6), Left(5)]
+
+
+def test_flat_map_async():
+    # GIVEN: a coroutine function returning an Either
+    async def f(x):
+        await asyncio.sleep(0)
+        return Right(x + 1) if x > 0 else Left(x)
+
+    # WHEN: it's applied to Right and Left through flat_map_async
+    async def chain():
+        return [
+            await Right(5).flat_map_async(f),
+            await Right(-5).flat_map_async(f),
+            await Left(5).flat_map_async(f),
+        ]
+
+    # THEN: the result is that of the coroutine function for Right, and the Left otherwise
+    assert asyncio.run(chain()) == [Right(6), Left(-5), Left(5)]
+
+
+def test_lazy_right():
+    # GIVEN: a chain of map and flat_map calls recorded lazily on a Right
+    f = lambda x: x + 1
+    g = lambda x: Right(x * 10)
+    chain = Right(5).lazy().map(f).flat_map(g).map(f)
+    # WHEN: the chain is forced
+    # THEN: the result is the same as the eager chain
+    assert chain.evaluate() == Right(5).map(f).flat_map(g).map(f) == Right(61)
+    assert chain.fold(lambda x: 0, lambda x: x) == 61
+
+
+def test_lazy_left():
+    # GIVEN: lazy chains starting from a Left, or with a flat_map step returning Left
+    f = lambda x: x + 1
+    chains = [
+        Left(5).lazy().map(f),
+        Right(5).lazy().flat_map(lambda x: Left(x)).map(f),
+    ]
+    # WHEN: the chains are forced
+    # THEN: the result is the Left
+    assert all(chain.evaluate() == Left(5) for chain in chains)
+    assert all(chain.fold(lambda x: -x, f) == -5 for chain in chains)
+
+
+def test_tail_rec_m_right():
+    # GIVEN: a loop step that counts down from a value much larger than the recursion limit
+    start = sys.getrecursionlimit() * 10
+    f = lambda n: Right(Left(n - 1) if n > 0 else Right("done"))
+    # WHEN: it's run with tail_rec_m
+    # THEN: the result is Right of the final value, without exhausting the stack
+    assert Either.tail_rec_m(start, f) == Right("done")
+
+
+def test_tail_rec_m_left():
+    # GIVEN: a loop step that returns a Left at some point
+    f = lambda n: Right(Left(n + 1)) if n < 10 else Left(f"stopped at {n}")
+    # WHEN: it's run with tail_rec_m
+    # THEN: the result is the Left
+    assert Either.tail_rec_m(0, f) == Left("stopped at 10")
+
+
+def test_hash():
+    # GIVEN: Eithers with equal and different values and sides
+    eithers = [Right(5), Right(5), Left(5), Left(5), Right(10)]
+    # WHEN: they're used as keys of a dictionary
+    counts = {}
+    for either in eithers:
+        counts[either] = counts.get(either, 0) + 1
+    # THEN: equal Eithers are grouped together
+    assert counts == {Right(5): 2, Left(5): 2, Right(10): 1}
+
+
+def test_hash_is_cached():
+    # GIVEN: an instance of Right with a hashable value
+    r = Right(("Pk", 5))
+    # WHEN: its hash is computed twice
+    # THEN: the same hash is returned, from the cache the second time
+    assert hash(r) == hash(r) == r._hash
+
+
+def test_pickle():
+    # GIVEN: instances of Right and Left
+    eithers = [Right(5), Left("Pk")]
+    # WHEN: they're pickled and unpickled
+    # THEN: they're equal to the initial instances
+    assert pickle.loads(pickle.dumps(eithers)) == eithers
+
+
+def test_eq_other_types():
+    # GIVEN: instances of Right and Left
+    # WHEN: they're compared with objects that aren't an Either
+    # THEN: they're not equal, and no exception is raised
+    assert Right(1) != 1 and Left("Pk") != "Pk" and not Right(None) == None
+    assert Right(1) == Right(1) and Left(1) == Left(1) and Right(1) != Left(1)
+
+
+def _counted(values, pulled):
+    for value in values:
+        pulled.append(value)
+        yield value
+
+
+def test_sequence():
+    # GIVEN: iterables of Eithers
+    # WHEN: they're sequenced
+    # THEN: a Right of all the contents is returned, or the first Left
+    assert Either.sequence([Right(1), Right(2)]) == Right([1, 2])
+    assert Either.sequence([Right(1), Left("Pk"), Left("Chrmndr")]) == Left("Pk")
+
+
+def test_traverse_stops_at_first_left():
+    # GIVEN: an iterable that is consumed lazily
+    pulled = []
+    values = _counted(range(10**6), pulled)
+    # WHEN: it's traversed with a function returning a Left on its third element
+    result = Either.traverse(lambda x: Left(x) if x == 2 else Right(x), values)
+    # THEN: the Left is returned, without pulling the elements after it
+    assert result == Left(2) and pulled == [0, 1, 2]
+
+
+def test_base_class_cannot_be_instantiated():
+    # GIVEN: the Either base class
+    # WHEN: it's instantiated directly
+    # THEN: a TypeError is raised, as only Left and Right can be
+    with pytest.raises(TypeError):
+        Either(1)
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+
+import pytest
+
+import algae
+
+# Generous bounds in microseconds, as reported by python -X importtime, so
+# that they catch new eager imports rather than a slow machine.
+IMPORT_BUDGET_US = 10_000
+CORE_IMPORT_BUDGET_US = 150_000
+
+
+def _import_times(code: str) -> dict:
+    """Run code in a fresh interpreter and return the cumulative import time of each module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_loads_no_submodule():
+    # GIVEN: a fresh interpreter
+    # WHEN: algae is imported
+    times = _import_times("import algae")
+    # THEN: none of its submodules, nor NumPy or asyncio, are imported, within the budget
+    assert not [module for module in times if module.startswith("algae.")]
+    assert "numpy" not in times and "asyncio" not in times
+    assert times["algae"] < IMPORT_BUDGET_US
+
+
+def test_core_types_load_no_optional_parts():
+    # GIVEN: a fresh interpreter
+    # WHEN: the core types are accessed through the package
+    times = _import_times("import algae; algae.Option, algae.Either, algae.Try")
+    # THEN: the batch, parallel and NumPy parts aren't loaded, and the budget is met
+    assert {"algae.batch", "algae.parallel", "numpy", "asyncio"}.isdisjoint(times)
+    assert sum(times[m] for m in ("algae.option", "algae.either", "algae.try_")) < (
+        CORE_IMPORT_BUDGET_US
+    )
+
+
+def test_lazy_exports():
+    # GIVEN: the names exported by the package
+    # WHEN: they're accessed
+    # THEN: they're the objects defined by the submodules
+    from algae.option import Some
+    from algae.stream import first_failure
+
+    assert algae.Some is Some and algae.stream.first_failure is first_failure
+    assert set(algae.__all__) <= set(dir(algae))
+    for name in algae.__all__:
+        assert getattr(algae, name) is not None
+
+
+def test_unknown_attribute():
+    # GIVEN: a name that isn't exported
+    # WHEN: it's accessed
+    # THEN: an AttributeError is raised
+    with pytest.raises(AttributeError):
+        algae.Pikachu
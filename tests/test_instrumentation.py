@@ -0,0 +1,91 @@
+import pytest
+
+from algae import instrumentation
+from algae.either import Left, Right
+from algae.option import LazyOption, Nothing, Option, Some
+from algae.try_ import Failure, Success, Try
+
+
+@pytest.fixture
+def registry():
+    instrumentation.registry.reset()
+    yield instrumentation.registry
+    instrumentation.disable()
+    instrumentation.registry.reset()
+
+
+def _parse(text):
+    return int(text)
+
+
+def test_counts(registry):
+    # GIVEN: instrumentation enabled without timing
+    instrumentation.enable()
+    # WHEN: values of each type are created
+    Option.apply(None)
+    Some(1).flat_map(lambda x: Nothing())
+    Right(1).flat_map(lambda x: Left("Pk"))
+    Try.apply(int, "25")
+    Try.apply(int, "Pk")
+    Failure(KeyError("Pk")).to_option()
+    snapshot = registry.snapshot()
+    # THEN: they're counted per type, and Failures per exception type
+    assert snapshot.counts == {
+        "Some": 1,
+        "Nothing": 3,
+        "Right": 1,
+        "Left": 1,
+        "Success": 1,
+        "Failure": 2,
+    }
+    assert snapshot.failures == {"builtins.ValueError": 1, "builtins.KeyError": 1}
+    assert snapshot.rates == {"Nothing": 0.75, "Left": 0.5, "Failure": 2 / 3}
+    assert snapshot.calls == {}
+
+
+@pytest.mark.parametrize("timing", [False, True])
+def test_counts_every_nothing_once(registry, timing):
+    # GIVEN: instrumentation enabled
+    instrumentation.enable(timing=timing)
+    # WHEN: empty Options are produced in every way, and passed on
+    Option.sequence([Some(1), Nothing()])
+    Option.traverse(Option.apply, [1, None])
+    Some(1).flat_map(lambda x: Nothing())
+    LazyOption(Some(1)).flat_map(lambda x: Option.when(False, x)).evaluate()
+    LazyOption(Nothing()).evaluate()
+    # THEN: each one is counted once, when it's produced
+    assert registry.snapshot().counts == {"Some": 4, "Nothing": 5}
+
+
+def test_timing(registry):
+    # GIVEN: instrumentation enabled with timing
+    instrumentation.enable(timing=True)
+    # WHEN: a chain of steps runs twice
+    for text in ["25", "Pk"]:
+        (
+            Try.apply(str.strip, text)
+            .map(_parse)
+            .flat_map(lambda x: Success(x * 2) if x > 0 else Failure(ValueError()))
+        )
+    calls = registry.snapshot().calls
+    # THEN: each step has its own calls and failures, lambdas being named by line
+    assert calls[f"{__name__}._parse"][:2] == (2, 1)
+    assert calls["builtins.str.strip"][:2] == (2, 0)
+    [(name, stats)] = [(k, v) for k, v in calls.items() if "<lambda>" in k]
+    assert name.startswith(f"{__name__}.test_timing.<locals>.<lambda>:")
+    assert stats.calls == 1 and stats.failures == 0
+    assert stats.total_seconds >= stats.max_seconds > 0
+
+
+def test_disable_restores_methods(registry):
+    # GIVEN: the methods of the types before instrumentation is enabled
+    classes = [Option, Some, Nothing, LazyOption, Right, Left, Success, Failure, Try]
+    before = [dict(cls.__dict__) for cls in classes]
+    # WHEN: instrumentation is enabled and then disabled
+    instrumentation.enable(timing=True)
+    assert instrumentation.is_enabled() and Some.map is not before[1]["map"]
+    instrumentation.disable()
+    Some(1).map(str)
+    # THEN: the original methods are back, and nothing is counted anymore
+    assert [dict(cls.__dict__) for cls in classes] == before
+    assert not instrumentation.is_enabled() and registry.snapshot().counts == {}
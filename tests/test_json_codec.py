@@ -0,0 +1,122 @@
+import io
+import json
+
+import pytest
+
+from algae import json_codec
+from algae.either import Left, Right
+from algae.option import Nothing, Some
+from algae.try_ import Failure, Success
+
+
+class PokemonError(Exception):
+    pass
+
+
+def test_schema():
+    # GIVEN: a value of each type
+    # WHEN: they're encoded
+    encoded = [
+        json.loads(json_codec.dumps(value))
+        for value in [
+            Some(1),
+            Nothing(),
+            Left("Chrmndr"),
+            Right([25]),
+            Success({"Pkch": 25}),
+            Failure(KeyError("Sqrtl")),
+        ]
+    ]
+    # THEN: each one is tagged with its type
+    assert encoded == [
+        {"some": 1},
+        None,
+        {"left": "Chrmndr"},
+        {"right": [25]},
+        {"success": {"Pkch": 25}},
+        {"failure": {"type": "builtins.KeyError", "args": ["Sqrtl"]}},
+    ]
+
+
+def test_round_trip():
+    # GIVEN: values of every type, including a Failure with a user defined exception
+    values = [
+        Some("Pk"),
+        Nothing(),
+        Left(1.5),
+        Right(None),
+        Success([1, 2]),
+        Failure(PokemonError("Pk", 25)),
+    ]
+    # WHEN: they're written to a file and read back
+    fp = io.StringIO()
+    json_codec.dump(values, fp)
+    fp.seek(0)
+    decoded = list(json_codec.load(fp))
+    # THEN: the same values are returned, one per line
+    assert decoded == values
+    assert len(fp.getvalue().splitlines()) == len(values)
+    assert decoded[1] is Nothing()
+
+
+def test_nested_values():
+    # GIVEN: values nested in other values
+    values = [Right(Success(1)), Some(Nothing()), Left([Failure(KeyError("Pk"))])]
+    # WHEN: they're encoded and decoded
+    lines = list(json_codec.iterencode(values))
+    decoded = list(json_codec.iterdecode(lines))
+    # THEN: nested values use the same schema, and only the outer ones are decoded
+    assert decoded == [
+        Right({"success": 1}),
+        Some(None),
+        Left([{"failure": {"type": "builtins.KeyError", "args": ["Pk"]}}]),
+    ]
+
+
+def test_custom_default():
+    # GIVEN: a nested value and a value json can't encode
+    value = Right([Some(1), {2}])
+    # WHEN: it's encoded with a default function for non JSON values
+    # THEN: the default function is used for what the schema doesn't cover
+    assert json_codec.dumps(value, default=list) == '{"right": [{"some": 1}, [2]]}'
+
+
+def test_multi_line_options_rejected():
+    # GIVEN: encoder options that would spread a value over several lines
+    # WHEN: they're used to write JSON Lines
+    # THEN: a ValueError is raised before anything is written
+    for kwargs in [{"indent": 2}, {"separators": (",\n", ": ")}]:
+        with pytest.raises(ValueError):
+            json_codec.iterencode([Right([1, 2])], **kwargs)
+    assert json_codec.dumps(Right([1]), indent=2) == '{"right": [\n  1\n]}'
+
+
+def test_streaming():
+    # GIVEN: an infinite iterable of values
+    def values():
+        i = 0
+        while True:
+            yield Some(i)
+            i += 1
+
+    # WHEN: it's encoded and decoded lazily
+    decoded = json_codec.iterdecode(json_codec.iterencode(values()))
+    # THEN: values are produced as they're consumed
+    assert [next(decoded) for _ in range(3)] == [Some(0), Some(1), Some(2)]
+
+
+def test_unknown_exception_type():
+    # GIVEN: a Failure whose exception type can't be found
+    line = '{"failure": {"type": "not_loaded.module.Error", "args": ["Pk"]}}'
+    # WHEN: it's decoded
+    # THEN: the exception is rebuilt as an Exception with the same args
+    assert json_codec.loads(line) == Failure(Exception("Pk"))
+
+
+def test_invalid_data():
+    # GIVEN: JSON values that don't follow the schema
+    # WHEN: they're decoded
+    # THEN: a DecodeError is raised
+    for line in ['{"Pkch": 25}', "25", '{"some": 1, "right": 2}', '{"failure": "Pk"}']:
+        with pytest.raises(json_codec.DecodeError):
+            json_codec.loads(line)
@@ -0,0 +1,78 @@
+from algae.either import Left, Right
+from algae.option import Nothing, Option, Some
+from algae.try_ import Failure, Success, Try
+
+
+def describe(value):
+    match value:
+        case Some(x):
+            return f"some {x}"
+        case Nothing():
+            return "nothing"
+        case Right(x):
+            return f"right {x}"
+        case Left(x):
+            return f"left {x}"
+        case Success(x):
+            return f"success {x}"
+        case Failure(e):
+            return f"failure {e.args[0]}"
+
+
+def test_match_concrete_classes():
+    # GIVEN: an instance of each concrete class
+    values = [
+        Some(25),
+        Nothing(),
+        Right("Pk"),
+        Left("Chrmndr"),
+        Success(7),
+        Failure(ValueError("Sqrtl")),
+    ]
+    # WHEN: they're matched against class patterns
+    # THEN: each one matches its own class, and its content is bound
+    assert [describe(value) for value in values] == [
+        "some 25",
+        "nothing",
+        "right Pk",
+        "left Chrmndr",
+        "success 7",
+        "failure Sqrtl",
+    ]
+
+
+def test_match_nested_patterns():
+    # GIVEN: values nesting other values
+    # WHEN: they're matched against nested and literal patterns
+    # THEN: the nested contents are destructured
+    match Success(Some(Right(1))):
+        case Success(Some(Right(x))):
+            assert x == 1
+        case _:
+            raise AssertionError
+    match Option.apply(None):
+        case Some(_):
+            raise AssertionError
+        case Nothing():
+            pass
+    match Try.apply(int, "25"):
+        case Success(25):
+            pass
+        case _:
+            raise AssertionError
+
+
+def test_match_base_classes():
+    # GIVEN: instances of the concrete classes
+    # WHEN: they're matched against the base classes
+    # THEN: the base classes bind the content too
+    match Some("Pk"):
+        case Option(x):
+            assert x == "Pk"
+        case _:
+            raise AssertionError
+    match Nothing():
+        case Some(_):
+            raise AssertionError
+        case Option():
+            pass
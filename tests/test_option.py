@@ -1,5 +1,11 @@
+import asyncio
+import copy
+import pickle
+import sys
+
 import pytest
 
+from algae.either import Left, Right
 from algae.option import NoElement, Nothing, Option, Some
 
 
@@ -207,3 +213,233 @@ def test_not_equals():
         and other_some != nothing
         and nothing != other_some
     )
+
+
+class _Slotted:
+    __slots__ = ("_value", "_hash")
+
+    def __init__(self, value):
+        self._value = value
+
+
+class _Empty:
+    __slots__ = ()
+
+
+def test_instances_have_no_dict():
+    # GIVEN: an instance of Some and an instance of Nothing
+    instances = (Some("Pkch"), Nothing())
+    # WHEN: their attributes are inspected
+    # THEN: none of them carries a __dict__
+    assert all(not hasattr(instance, "__dict__") for instance in instances)
+
+
+def test_instance_size():
+    # GIVEN: an instance of Some and an instance of Nothing
+    some = Some("Pkch")
+    nothing = Nothing()
+    # WHEN: their size is compared to plain Python objects with the same slots
+    # THEN: they are not any bigger
+    assert sys.getsizeof(some) == sys.getsizeof(_Slotted("Pkch"))
+    assert sys.getsizeof(nothing) == sys.getsizeof(_Empty())
+
+
+def test_nothing_is_singleton():
+    # GIVEN: Nothing instances obtained in all the supported ways
+    instances = (
+        Nothing(),
+        Option.apply(None),
+        Option.when(False, "Pk"),
+        Some("Pk").flat_map(lambda x: Nothing()),
+    )
+    # WHEN: their identity is checked
+    # THEN: they are all the same object
+    assert all(instance is Nothing() for instance in instances)
+
+
+def test_nothing_singleton_survives_pickling_and_copying():
+    # GIVEN: an instance of Nothing
+    nothing = Nothing()
+    # WHEN: it's pickled with every protocol, copied and deep-copied
+    restored = [
+        pickle.loads(pickle.dumps(nothing, protocol))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+    ]
+    restored += [copy.copy(nothing), copy.deepcopy(nothing)]
+    # THEN: the result is always the same instance
+    assert all(instance is nothing for instance in restored)
+
+
+def test_nothing_repr():
+    # GIVEN: an instance of Nothing
+    # WHEN: its representation is computed
+    # THEN: it is unchanged by the singleton
+    assert repr(Nothing()) == "algae.Nothing"
+
+
+def test_map_async_some():
+    # GIVEN: an instance of Some and a coroutine function acting on its value
+    some = Some("Pk")
+
+    async def f(x):
+        await asyncio.sleep(0)
+        return x + "two"
+
+    # WHEN: the coroutine function is applied with map_async
+    # THEN: the result is Some of the awaited value
+    assert asyncio.run(some.map_async(f)) == Some("Pktwo")
+
+
+def test_map_async_nothing():
+    # GIVEN: an instance of Nothing and a coroutine function
+    async def f(x):
+        return x + "two"
+
+    # WHEN: the coroutine function is applied with map_async
+    # THEN: the result is Nothing
+    assert asyncio.run(Nothing().map_async(f)) is Nothing()
+
+
+def test_flat_map_async():
+    # GIVEN: a coroutine function returning an Option
+    async def f(x):
+        await asyncio.sleep(0)
+        return Option.when(x > 0, x)
+
+    # WHEN: it's applied with flat_map_async to Some and Nothing
+    async def chain():
+        return [
+            await Some(1).flat_map_async(f),
+            await Some(-1).flat_map_async(f),
+            await Nothing().flat_map_async(f),
+        ]
+
+    # THEN: the result is that of the coroutine function for Some, and Nothing otherwise
+    assert asyncio.run(chain()) == [Some(1), Nothing(), Nothing()]
+
+
+def test_lazy_some():
+    # GIVEN: an instance of Some
+    some = Some(2)
+    # AND: a chain of map and flat_map calls recorded lazily on it
+    calls = []
+    chain = (
+        some.lazy()
+        .map(lambda x: calls.append(x) or x + 1)
+        .flat_map(lambda x: Some(x * 10))
+        .map(str)
+    )
+    # WHEN: the chain is forced
+    # THEN: no function has been called before, and the result is that of the eager chain
+    assert calls == []
+    assert chain.evaluate() == some.map(lambda x: x + 1).flat_map(
+        lambda x: Some(x * 10)
+    ).map(str)
+    assert chain.get() == "30" and chain.get_or_else("") == "30"
+    assert chain.fold("", lambda x: x + "!") == "30!"
+
+
+def test_lazy_nothing():
+    # GIVEN: a lazy chain in which a flat_map step returns Nothing
+    chain = Some(2).lazy().flat_map(lambda x: Nothing()).map(lambda x: x + 1)
+    # WHEN: the chain is forced
+    # THEN: the result is Nothing
+    assert chain.evaluate() is Nothing() and chain.get_or_else(0) == 0
+    assert chain.fold("empty", str) == "empty"
+    with pytest.raises(NoElement):
+        chain.get()
+
+
+def test_tail_rec_m_some():
+    # GIVEN: a loop step that counts down from a value much larger than the recursion limit
+    start = sys.getrecursionlimit() * 10
+    f = lambda n: Some(Left(n - 1) if n > 0 else Right("done"))
+    # WHEN: it's run with tail_rec_m
+    # THEN: the result is Some of the final value, without exhausting the stack
+    assert Option.tail_rec_m(start, f) == Some("done")
+
+
+def test_tail_rec_m_nothing():
+    # GIVEN: a loop step that returns Nothing at some point
+    f = lambda n: Some(Left(n + 1)) if n < 10 else Nothing()
+    # WHEN: it's run with tail_rec_m
+    # THEN: the result is Nothing
+    assert Option.tail_rec_m(0, f) is Nothing()
+
+
+def test_hash():
+    # GIVEN: Options with equal and different values
+    options = [Some("Pk"), Some("Pk"), Some("Pkch"), Nothing(), Option.apply(None)]
+    # WHEN: they're used as members of a set
+    # THEN: equal Options are deduplicated
+    assert set(options) == {Some("Pk"), Some("Pkch"), Nothing()}
+    assert hash(Some(1)) == hash(Some(1.0))
+
+
+def test_hash_is_cached():
+    # GIVEN: an instance of Some with a hashable value
+    some = Some(("Pk", 42))
+    # WHEN: its hash is computed twice
+    # THEN: the same hash is returned, from the cache the second time
+    assert hash(some) == hash(some) == some._hash
+
+
+def test_hash_unhashable_value():
+    # GIVEN: an instance of Some with a value that can't be hashed
+    some = Some(["Pk"])
+    # WHEN: its hash is computed
+    # THEN: a TypeError is raised, as for the value itself
+    with pytest.raises(TypeError):
+        hash(some)
+
+
+def test_pickle_some():
+    # GIVEN: an instance of Some whose hash has been cached
+    some = Some("Pk")
+    hash(some)
+    # WHEN: it's pickled and unpickled
+    restored = pickle.loads(pickle.dumps(some))
+    # THEN: it's equal to the initial instance, and the cached hash isn't carried over
+    assert restored == some and not hasattr(restored, "_hash")
+
+
+def test_eq_other_types():
+    # GIVEN: instances of Some and Nothing
+    # WHEN: they're compared with objects that aren't an Option
+    # THEN: they're not equal, and no exception is raised
+    assert Some(1) != 1 and Nothing() != None and not Some("Pk") == "Pk"
+    assert Some(1) == Some(1) and Nothing() == Nothing() and Some(1) != Nothing()
+
+
+def _counted(values, pulled):
+    for value in values:
+        pulled.append(value)
+        yield value
+
+
+def test_sequence():
+    # GIVEN: iterables of Options
+    # WHEN: they're sequenced
+    # THEN: a Some of all the contents is returned, or the first Nothing
+    assert Option.sequence([Some(1), Some(2)]) == Some([1, 2])
+    assert Option.sequence([]) == Some([])
+    assert Option.sequence([Some(1), Nothing(), Some(3)]) is Nothing()
+
+
+def test_traverse_stops_at_first_nothing():
+    # GIVEN: an iterable that is consumed lazily
+    pulled = []
+    values = _counted(range(10**6), pulled)
+    # WHEN: it's traversed with a function returning Nothing on its third element
+    result = Option.traverse(lambda x: Option.when(x != 2, x), values)
+    # THEN: Nothing is returned, without pulling the elements after it
+    assert result is Nothing() and pulled == [0, 1, 2]
+    assert Option.traverse(Option.apply, ["Pk", "Chrmndr"]) == Some(["Pk", "Chrmndr"])
+
+
+def test_base_class_cannot_be_instantiated():
+    # GIVEN: the Option base class
+    # WHEN: it's instantiated directly
+    # THEN: a TypeError is raised, as only Some and Nothing can be
+    with pytest.raises(TypeError):
+        Option()
@@ -0,0 +1,159 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from algae.either import Left, Right
+from algae.parallel import map_either, map_try, traverse_either, traverse_try
+from algae.try_ import Failure, Success, Try
+
+
+class CodeError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def check_code(value: int):
+    if value % 2:
+        raise CodeError(value, f"{value} is odd")
+    return value
+
+
+def parse_positive(value: str):
+    number = int(value)
+    return Right(number) if number > 0 else Left(f"{number} is not positive")
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 5])
+def test_map_try_ordered(chunksize):
+    # GIVEN: an unsafe function and inputs for which it might raise
+    values = ["1", "Pk", "3", "4", ""]
+    # WHEN: it's applied on a thread pool with map_try
+    results = list(map_try(int, values, max_workers=3, chunksize=chunksize))
+    # THEN: the results are those of Try.apply, in input order
+    assert results == [Try.apply(int, value) for value in values]
+
+
+def test_map_try_processes():
+    # GIVEN: an unsafe function that can be pickled and inputs for which it might raise
+    values = ["1", "Pk", "3"]
+    # WHEN: it's applied on a process pool with map_try
+    results = list(map_try(int, values, processes=True, max_workers=2, chunksize=2))
+    # THEN: the results are those of Try.apply, in input order
+    assert results == [Success(1), Try.apply(int, "Pk"), Success(3)]
+
+
+def test_map_try_processes_custom_exception():
+    # GIVEN: a function raising an exception whose __init__ doesn't match its args
+    values = range(4)
+    # WHEN: it's applied on a process pool with map_try
+    results = list(map_try(check_code, values, processes=True, max_workers=2))
+    # THEN: each exception is returned in its own Failure, with its type and args
+    assert results == [
+        Success(0),
+        Failure(CodeError(1, "1 is odd")),
+        Success(2),
+        Failure(CodeError(3, "3 is odd")),
+    ]
+
+
+def test_map_try_as_completed():
+    # GIVEN: a function that is slower for the first input
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def f(x):
+        if x == 0:
+            first_started.set()
+            release_first.wait(5)
+        else:
+            first_started.wait(5)
+        return x
+
+    # WHEN: it's applied on a thread pool with ordered set to False
+    results = map_try(f, range(3), max_workers=3, ordered=False)
+    # THEN: results are yielded as soon as they're ready
+    first = [next(results), next(results)]
+    release_first.set()
+    assert sorted(r.get() for r in first) == [1, 2] and next(results) == Success(0)
+
+
+def test_map_try_fail_fast():
+    # GIVEN: a function that fails on one input
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return 10 // x
+
+    # WHEN: it's applied on a single thread with fail_fast
+    results = list(map_try(f, [1, 0, 2, 3, 4, 5], max_workers=1, fail_fast=True))
+    # THEN: the results stop at the first Failure, and the remaining work is cancelled
+    assert results == [
+        Success(10),
+        Failure(ZeroDivisionError("integer division or modulo by zero")),
+    ]
+    assert len(calls) < 6
+
+
+def test_traverse_try_returns_at_first_failure():
+    # GIVEN: a function that fails on the first input, and blocks on the others
+    release = threading.Event()
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        if x == 0:
+            raise ValueError("Pk")
+        release.wait(5)
+        return x
+
+    # WHEN: it's traversed on a thread pool, and in a single chunk
+    start = time.monotonic()
+    result = traverse_try(f, range(4), max_workers=4)
+    elapsed = time.monotonic() - start
+    release.set()
+    # THEN: the first Failure is returned without waiting for the running calls
+    assert result == Failure(ValueError("Pk")) and elapsed < 2
+    calls.clear()
+    assert traverse_try(f, range(4), chunksize=4) == Failure(ValueError("Pk"))
+    assert calls == [0]
+
+
+def test_map_try_external_executor():
+    # GIVEN: an executor owned by the caller
+    with ThreadPoolExecutor(2) as executor:
+        # WHEN: map_try runs on it
+        results = list(map_try(lambda x: x + 1, range(3), executor=executor))
+        # THEN: the executor is still usable afterwards
+        assert results == [Success(1), Success(2), Success(3)]
+        assert executor.submit(lambda: 42).result() == 42
+
+
+def test_map_either():
+    # GIVEN: a function returning an Either
+    values = ["1", "-2", "3"]
+    # WHEN: it's applied on a thread pool with map_either
+    results = list(map_either(parse_positive, values, chunksize=2))
+    # THEN: the results are those of the function, in input order
+    assert results == [Right(1), Left("-2 is not positive"), Right(3)]
+
+
+def test_traverse_try():
+    # GIVEN: an unsafe function
+    # WHEN: it's traversed over inputs that are all valid, and over some that aren't
+    # THEN: the results are collected in a Success, or the first Failure is returned
+    assert traverse_try(int, ["1", "2", "3"], chunksize=2) == Success([1, 2, 3])
+    assert traverse_try(int, ["1", "Pk", "Pkch"]) == Try.apply(int, "Pk")
+
+
+def test_traverse_either():
+    # GIVEN: a function returning an Either
+    # WHEN: it's traversed over inputs that are all valid, and over some that aren't
+    # THEN: the values are collected in a Right, or the first Left is returned
+    assert traverse_either(parse_positive, ["1", "2"], processes=True) == Right([1, 2])
+    assert traverse_either(parse_positive, ["1", "-2", "-3"]) == Left(
+        "-2 is not positive"
+    )
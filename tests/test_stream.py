@@ -0,0 +1,75 @@
+from itertools import count, islice
+
+from algae import stream
+from algae.either import Left, Right
+from algae.option import Nothing, Option, Some
+from algae.try_ import Failure, Success, Try
+
+
+def test_apply():
+    # GIVEN: an infinite iterable of raw values
+    values = count(-2)
+    # WHEN: an unsafe function is applied to them with stream.apply
+    results = stream.apply(lambda x: 10 // x, values)
+    # THEN: the results are produced lazily, one Try per value
+    assert list(islice(results, 3)) == [
+        Success(-5),
+        Success(-10),
+        Try.apply(lambda: 10 // 0),
+    ]
+
+
+def test_map_and_flat_map():
+    # GIVEN: an iterable of Options
+    values = [Some(1), Nothing(), Some(3)]
+    # WHEN: functions are applied to them with stream.map and stream.flat_map
+    results = stream.flat_map(
+        lambda x: Option.when(x > 2, x), stream.map(lambda x: x + 1, values)
+    )
+    # THEN: each function is applied to each value as map and flat_map would
+    assert list(results) == [Nothing(), Nothing(), Some(4)]
+
+
+def test_filter_map():
+    # GIVEN: raw values and a function returning a Try
+    values = ["1", "Pk", "3"]
+    f = lambda x: Try.apply(int, x)
+    # WHEN: the function is applied with filter_map
+    # THEN: only the contents of the successful results are yielded
+    assert list(stream.filter_map(f, values)) == [1, 3]
+
+
+def test_collect_successes_and_failures():
+    # GIVEN: an iterable mixing all the types
+    error = ValueError("Pk")
+    values = [Some(1), Nothing(), Right(2), Left("Chrmndr"), Success(3), Failure(error)]
+    # WHEN: the successes and failures are collected
+    # THEN: the contents of each kind are yielded, and Nothing is skipped
+    assert list(stream.collect_successes(values)) == [1, 2, 3]
+    assert list(stream.collect_failures(values)) == ["Chrmndr", error]
+
+
+def test_take_until_failure():
+    # GIVEN: an infinite iterable of Eithers with a Left
+    values = (Right(i) if i != 2 else Left(i) for i in count())
+    # WHEN: values are taken until the first failure
+    # THEN: the iteration stops there
+    assert list(stream.take_until_failure(values)) == [Right(0), Right(1), Left(2)]
+    assert next(values) == Right(3)
+
+
+def test_take_until_failure_exclusive():
+    # GIVEN: an iterable of Options with a Nothing
+    values = [Some(1), Nothing(), Some(3)]
+    # WHEN: values are taken until the first failure, excluded
+    # THEN: only the values before it are yielded
+    assert list(stream.take_until_failure(values, inclusive=False)) == [Some(1)]
+
+
+def test_first_failure():
+    # GIVEN: an infinite iterable of Trys with a Failure
+    values = stream.apply(lambda x: 10 // (3 - x), count())
+    # WHEN: the first failure is looked for
+    # THEN: it's returned as soon as it's found
+    assert stream.first_failure(values) == Some(Try.apply(lambda: 10 // 0))
+    assert stream.first_failure([Some(1)]) == Nothing()
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from algae import timeout
+from algae.timeout import Deadline
+from algae.try_ import Failure, Success
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    # let the calls that timed out finish
+    event.set()
+
+
+def test_apply_success_and_failure():
+    # GIVEN: calls that complete in time
+    # WHEN: they're applied with a timeout
+    # THEN: they return like Try.apply
+    assert timeout.apply(1.0, int, "25") == Success(25)
+    assert timeout.apply(1.0, int, "Pk") == Failure(
+        ValueError("invalid literal for int() with base 10: 'Pk'")
+    )
+    assert timeout.apply(None, sorted, [2, 1], reverse=True) == Success([2, 1])
+
+
+def test_apply_timeout(release):
+    # GIVEN: a call that gets stuck
+    # WHEN: it's applied with a timeout
+    start = time.monotonic()
+    result = timeout.apply(0.05, release.wait)
+    # THEN: a Failure holding a TimeoutError is returned once the timeout passes
+    assert time.monotonic() - start < 1.0
+    assert result.fold(type, lambda _: None) is TimeoutError
+
+
+def test_apply_timeout_raised_by_call():
+    # GIVEN: a call that raises a TimeoutError of its own
+    def connect():
+        raise TimeoutError("connection timed out")
+
+    # WHEN: it's applied with a timeout
+    # THEN: its own exception is returned
+    assert timeout.apply(1.0, connect) == Failure(TimeoutError("connection timed out"))
+
+
+def test_workers_are_reused():
+    # GIVEN: calls that record the thread they run on
+    # WHEN: they're applied one after the other
+    threads = {timeout.apply(1.0, threading.get_ident).get() for _ in range(20)}
+    # THEN: they run on the pool's workers rather than on a new thread each
+    assert len(threads) < 20 and threading.get_ident() not in threads
+
+
+def test_stuck_workers_dont_block_new_calls(release):
+    # GIVEN: a call stuck on a worker
+    timeout.apply(0.01, release.wait)
+    # WHEN: another call is applied
+    # THEN: it runs on another worker
+    assert timeout.apply(1.0, str, 25) == Success("25")
+
+
+def test_deadline_shared_by_chain(release):
+    # GIVEN: a deadline shared by the steps of a chain, the second of which gets stuck
+    deadline = Deadline(0.1)
+    # WHEN: the chain runs
+    start = time.monotonic()
+    result = (
+        deadline.apply(int, "25")
+        .flat_map(deadline.bound(lambda x: release.wait() and x))
+        .flat_map(deadline.bound(str))
+    )
+    # THEN: the whole chain fails with a TimeoutError within the budget
+    assert time.monotonic() - start < 1.0
+    assert result.fold(type, lambda _: None) is TimeoutError and deadline.expired
+
+
+def test_expired_deadline():
+    # GIVEN: a deadline whose time has passed
+    now = [0.0]
+    deadline = Deadline(1.0, timer=lambda: now[0])
+    now[0] = 2.0
+    calls = []
+    # WHEN: a call is applied through it
+    result = deadline.apply(calls.append, "Pk")
+    # THEN: it fails without calling the function
+    assert result.fold(type, lambda _: None) is TimeoutError and calls == []
+    assert deadline.remaining() == 0.0
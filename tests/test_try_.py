@@ -1,10 +1,15 @@
+import asyncio
+import functools
 import math
+import pickle
+import sys
+import weakref
 
 import pytest
 
 from algae.either import Left, Right
 from algae.option import Nothing, Some
-from algae.try_ import Failure, Success, Try
+from algae.try_ import Failure, Success, Try, set_lightweight_failures
 
 
 def unsafe_f(value: int):
@@ -220,7 +225,7 @@ def test_to_option_failure():
     fail = Failure(exc)
     # WHEN: .to_option is called on the Failure
     # THEN: the result is Nothing
-    assert fail.to_option() == Nothing()
+    assert fail.to_option() == Nothing() and fail.to_option() is Nothing()
 
 
 def test_equals_success():
@@ -269,3 +274,316 @@ def test_not_equals():
         and other_fail != fail
         and fail != other_fail
     )
+
+
+class _Slotted:
+    __slots__ = ("_value", "_hash")
+
+    def __init__(self, value):
+        self._value = value
+
+
+def test_instances_have_no_dict():
+    # GIVEN: an instance of Success and an instance of Failure
+    instances = (Success(42), Failure(Exception(42)))
+    # WHEN: their attributes are inspected
+    # THEN: none of them carries a __dict__
+    assert all(not hasattr(instance, "__dict__") for instance in instances)
+
+
+def test_instance_size():
+    # GIVEN: an instance of Success and an instance of Failure
+    instances = (Success(42), Failure(Exception(42)))
+    # WHEN: their size is compared to a plain Python object with the same slots
+    # THEN: they are not any bigger
+    assert all(
+        sys.getsizeof(instance) == sys.getsizeof(_Slotted(42)) for instance in instances
+    )
+
+
+async def unsafe_async_f(value: int):
+    await asyncio.sleep(0)
+    return math.log(value)
+
+
+def test_apply_async():
+    # GIVEN: an unsafe coroutine function that might raise for some input values
+    # WHEN: its invocation is wrapped with Try.apply_async
+    async def apply():
+        return [
+            await Try.apply_async(unsafe_async_f, 1),
+            await Try.apply_async(unsafe_async_f, value=0),
+        ]
+
+    # THEN: the result is a Success with the awaited value, or a Failure with the exception
+    assert asyncio.run(apply()) == [
+        Success(0),
+        Failure(ValueError("math domain error")),
+    ]
+
+
+def test_map_async():
+    # GIVEN: a Success and a Failure
+    success = Success(1)
+    fail = Failure(Exception(42))
+
+    # WHEN: an unsafe coroutine function is applied to them with map_async
+    async def chain():
+        return [
+            await success.map_async(unsafe_async_f),
+            await (await success.map_async(unsafe_async_f)).map_async(unsafe_async_f),
+            await fail.map_async(unsafe_async_f),
+        ]
+
+    # THEN: exceptions raised while mapping a Success are captured as Failure
+    assert asyncio.run(chain()) == [
+        Success(0),
+        Failure(ValueError("math domain error")),
+        fail,
+    ]
+
+
+def test_flat_map_async():
+    # GIVEN: a coroutine function returning a Try
+    async def f(x):
+        return await Try.apply_async(unsafe_async_f, x)
+
+    # WHEN: it's applied to a Success and a Failure with flat_map_async
+    fail = Failure(Exception(42))
+
+    async def chain():
+        return [await Success(1).flat_map_async(f), await fail.flat_map_async(f)]
+
+    # THEN: the result is that of the coroutine function for Success, and the Failure otherwise
+    assert asyncio.run(chain()) == [Success(0), fail]
+
+
+def test_lazy_success():
+    # GIVEN: a chain of map and flat_map calls recorded lazily on a Success
+    f = lambda x: x + 1
+    g = lambda x: Try.apply(unsafe_f, x)
+    chain = Success(0).lazy().map(f).flat_map(g).map(f)
+    # WHEN: the chain is forced
+    # THEN: the result is the same as the eager chain
+    assert chain.evaluate() == Success(0).map(f).flat_map(g).map(f) == Success(1)
+    assert chain.get() == 1 and chain.get_or_else(0) == 1
+    assert chain.fold(lambda e: -1, lambda x: x * 2) == 2
+
+
+def test_lazy_failure():
+    # GIVEN: a lazy chain with a map step that raises an Exception
+    chain = Success(0).lazy().map(unsafe_f).map(lambda x: x + 1)
+    # WHEN: the chain is forced
+    # THEN: the result is a Failure containing the Exception
+    assert chain.evaluate() == Failure(ValueError("math domain error"))
+    assert chain.get_or_else(42) == 42 and chain.fold(lambda e: e.args, str) == (
+        "math domain error",
+    )
+    with pytest.raises(ValueError):
+        chain.get()
+
+
+def test_lazy_flat_map_exception_is_raised():
+    # GIVEN: a lazy chain with a flat_map step that raises an Exception
+    chain = Success(0).lazy().flat_map(unsafe_f)
+    # WHEN: the chain is forced
+    # THEN: the Exception is raised, as it would be by the eager flat_map
+    with pytest.raises(ValueError):
+        chain.evaluate()
+
+
+def test_tail_rec_m_success():
+    # GIVEN: a loop step that counts down from a value much larger than the recursion limit
+    start = sys.getrecursionlimit() * 10
+    f = lambda n: Success(Left(n - 1) if n > 0 else Right("done"))
+    # WHEN: it's run with tail_rec_m
+    # THEN: the result is Success of the final value, without exhausting the stack
+    assert Try.tail_rec_m(start, f) == Success("done")
+
+
+def test_tail_rec_m_failure():
+    # GIVEN: loop steps that return a Failure, or raise an Exception, at some point
+    fail = Failure(Exception(42))
+    returning = lambda n: Success(Left(n + 1)) if n < 10 else fail
+    raising = lambda n: Success(Left(n - 1)) if n > 0 else Success(Right(unsafe_f(n)))
+    # WHEN: they're run with tail_rec_m
+    # THEN: the result is the Failure
+    assert Try.tail_rec_m(0, returning) == fail
+    assert Try.tail_rec_m(10, raising) == Failure(ValueError("math domain error"))
+
+
+class _Payload:
+    pass
+
+
+def leaky_f(refs: list):
+    payload = _Payload()
+    refs.append(weakref.ref(payload))
+    try:
+        raise KeyError(42)
+    except KeyError:
+        raise ValueError("Pkch") from None
+
+
+def test_apply_keeps_traceback():
+    # GIVEN: a function raising an Exception while a local variable is alive
+    refs = []
+    # WHEN: it's called through Try.apply
+    fail = Try.apply(leaky_f, refs)
+    # THEN: the local variable is kept alive by the traceback of the Exception
+    assert refs[0]() is not None and fail.fold(lambda e: e.__traceback__, str)
+
+
+def test_apply_lightweight():
+    # GIVEN: a function raising an Exception while a local variable is alive
+    refs = []
+    # WHEN: it's called through Try.apply_lightweight
+    fail = Try.apply_lightweight(leaky_f, refs)
+    # THEN: the local variable is released, and the Failure keeps the Exception type and args
+    assert refs[0]() is None
+    assert fail == Failure(ValueError("Pkch"))
+    assert fail.to_either().fold(lambda e: e.args, str) == ("Pkch",)
+    assert (
+        fail.fold(lambda e: e.__traceback__ or e.__context__.__traceback__, str) is None
+    )
+
+
+def test_lightweight_failures_enabled_globally():
+    # GIVEN: lightweight failures enabled globally
+    set_lightweight_failures(True)
+    try:
+        # WHEN: a function raising an Exception is called through Try.apply and Success.map
+        refs = []
+        fails = [Try.apply(leaky_f, refs), Success(refs).map(leaky_f)]
+    finally:
+        set_lightweight_failures(False)
+    # THEN: the local variables are released, and the Failures keep the Exception type and args
+    assert [ref() for ref in refs] == [None, None]
+    assert fails == [Failure(ValueError("Pkch"))] * 2
+
+
+def test_hash():
+    # GIVEN: Successes and Failures, with Failures compared on Exception type and args
+    tries = [
+        Success(42),
+        Success(42),
+        Failure(ValueError(42)),
+        Failure(ValueError(42)),
+        Failure(KeyError(42)),
+    ]
+    # WHEN: they're used as members of a set
+    # THEN: equal Trys are deduplicated
+    assert set(tries) == {Success(42), Failure(ValueError(42)), Failure(KeyError(42))}
+
+
+def test_hash_as_lru_cache_argument():
+    # GIVEN: a function cached with functools.lru_cache
+    calls = []
+
+    @functools.lru_cache()
+    def f(t):
+        calls.append(t)
+        return t.get_or_else(0)
+
+    # WHEN: it's called twice with equal Trys
+    f(Success(42))
+    f(Success(42))
+    # THEN: the function is only called once
+    assert calls == [Success(42)]
+
+
+def test_hash_is_cached():
+    # GIVEN: an instance of Failure
+    fail = Failure(Exception(42))
+    # WHEN: its hash is computed twice
+    # THEN: the same hash is returned, from the cache the second time
+    assert hash(fail) == hash(fail) == fail._hash
+
+
+class _UnpicklableError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"failed with code {code}")
+        self.callback = lambda: code
+
+
+def test_pickle_success():
+    # GIVEN: an instance of Success
+    success = Success(42)
+    # WHEN: it's pickled and unpickled
+    # THEN: it's equal to the initial instance
+    assert pickle.loads(pickle.dumps(success)) == success
+
+
+def test_pickle_failure_with_unpicklable_exception():
+    # GIVEN: a Failure holding an Exception with a custom signature and an unpicklable attribute
+    fail = Try.apply(lambda: (_ for _ in ()).throw(_UnpicklableError(42)))
+    # WHEN: it's pickled and unpickled
+    restored = pickle.loads(pickle.dumps(fail))
+    # THEN: it keeps the Exception type and args
+    assert restored == fail == Failure(_UnpicklableError(42))
+
+
+def test_pickle_failure_with_local_exception():
+    # GIVEN: a Failure holding an Exception whose type is defined in a function
+    class LocalError(ValueError):
+        pass
+
+    fail = Failure(LocalError("Pk"))
+    # WHEN: it's pickled and unpickled
+    restored = pickle.loads(pickle.dumps(fail))
+    # THEN: the Exception is rebuilt with the closest importable type and the same args
+    assert restored == Failure(ValueError("Pk"))
+
+
+def test_eq_other_types():
+    # GIVEN: instances of Success and Failure
+    fail = Failure(ValueError("Pk"))
+    # WHEN: they're compared with objects that aren't a Try
+    # THEN: they're not equal, and no exception is raised
+    assert Success(1) != 1 and fail != ValueError("Pk") and not Success(1) == Some(1)
+    assert Success(1) == Success(1) and fail == Failure(ValueError("Pk"))
+    assert Success(1) != fail
+
+
+def _counted(values, pulled):
+    for value in values:
+        pulled.append(value)
+        yield value
+
+
+def test_sequence():
+    # GIVEN: iterables of Trys
+    # WHEN: they're sequenced
+    # THEN: a Success of all the contents is returned, or the first Failure
+    assert Try.sequence([Success(1), Success(2)]) == Success([1, 2])
+    assert Try.sequence(
+        [Success(1), Failure(ValueError("Pk")), Failure(KeyError())]
+    ) == Failure(ValueError("Pk"))
+
+
+def test_traverse_stops_at_first_failure():
+    # GIVEN: an iterable that is consumed lazily
+    pulled = []
+    values = _counted(["1", "2", "Pk", "4"] + ["5"] * 10**6, pulled)
+    # WHEN: it's traversed with a function failing on its third element
+    result = Try.traverse(lambda x: Try.apply(int, x), values)
+    # THEN: the Failure is returned, without pulling the elements after it
+    assert result == Failure(ValueError("invalid literal for int() with base 10: 'Pk'"))
+    assert pulled == ["1", "2", "Pk"]
+
+
+def test_traverse_captures_exceptions():
+    # GIVEN: a function that raises rather than returning a Failure
+    # WHEN: values are traversed with it
+    # THEN: the exception is returned as a Failure
+    assert Try.traverse(lambda x: Success(1 / x), [1, 0]) == Failure(
+        ZeroDivisionError("division by zero")
+    )
+
+
+def test_base_class_cannot_be_instantiated():
+    # GIVEN: the Try base class
+    # WHEN: it's instantiated directly
+    # THEN: a TypeError is raised, as only Success and Failure can be
+    with pytest.raises(TypeError):
+        Try()
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+
+from algae.either import Left, Right
+from algae.validated import Invalid, Valid, Validated
+
+
+def _positive(x):
+    return Valid(x) if x > 0 else Invalid("not positive")
+
+
+def _even(x):
+    return Valid(x) if x % 2 == 0 else Invalid("not even")
+
+
+def test_combine_collects_all_errors():
+    # GIVEN: a mix of Valid and Invalid values
+    validateds = [Valid(1), Invalid("Pk"), Valid(2), Invalid("Chrmndr", "Sqrtl")]
+    # WHEN: they're combined
+    # THEN: all the errors are collected, in order
+    assert Validated.combine(*validateds) == Invalid("Pk", "Chrmndr", "Sqrtl")
+    assert Validated.combine(Valid(1), Valid(2)) == Valid((1, 2))
+
+
+def test_map_n():
+    # GIVEN: a function of several arguments
+    # WHEN: it's applied to Validated arguments with map_n
+    # THEN: it's called only if they're all Valid
+    assert Validated.map_n(lambda a, b: a + b, Valid(1), Valid(2)) == Valid(3)
+    assert Validated.map_n(lambda a, b: a + b, Invalid("Pk"), Valid(2)) == Invalid("Pk")
+
+
+def test_validate():
+    # GIVEN: rules returning Validated values
+    # WHEN: values are checked against all of them
+    # THEN: every broken rule is reported
+    assert Validated.validate(-3, _positive, _even) == Invalid(
+        "not positive", "not even"
+    )
+    assert Validated.validate(4, _positive, _even) == Valid(4)
+
+
+def test_map_flat_map_fold():
+    # GIVEN: instances of Valid and Invalid
+    valid, invalid = Valid(2), Invalid("Pk")
+    # WHEN: map, flat_map and fold are called on them
+    # THEN: only the Valid ones are transformed
+    assert valid.map(str) == Valid("2") and invalid.map(str) is invalid
+    assert valid.flat_map(_even) == Valid(2) and Valid(-1).flat_map(_even) == Invalid(
+        "not even"
+    )
+    assert valid.fold(len, str) == "2" and invalid.fold(len, str) == 1
+    assert valid.get_or_else(0) == 2 and invalid.get_or_else(0) == 0
+
+
+def test_either_conversion():
+    # GIVEN: instances of Right and Left
+    # WHEN: they're converted to Validated and back
+    # THEN: Left turns into an Invalid with one error, which becomes a Left of errors
+    assert Validated.from_either(Right(1)) == Valid(1)
+    assert Validated.from_either(Left("Pk")) == Invalid("Pk")
+    assert Valid(1).to_either() == Right(1)
+    assert Invalid("Pk", "Chrmndr").to_either() == Left(("Pk", "Chrmndr"))
+
+
+def test_invalid_needs_errors():
+    # GIVEN: no errors
+    # WHEN: an Invalid is created
+    # THEN: a ValueError is raised
+    with pytest.raises(ValueError):
+        Invalid()
+
+
+def test_eq_hash_pickle():
+    # GIVEN: instances of Valid and Invalid
+    values = [Valid(1), Invalid("Pk", "Chrmndr")]
+    # WHEN: they're compared, hashed and pickled
+    # THEN: they behave as values
+    assert Valid(1) != Invalid(1) and Valid(1) != 1 and len({Valid(1), Valid(1)}) == 1
+    assert pickle.loads(pickle.dumps(values)) == values
+
+
+def test_base_class_cannot_be_instantiated():
+    # GIVEN: the Validated base class
+    # WHEN: it's instantiated directly
+    # THEN: a TypeError is raised, as only Valid and Invalid can be
+    with pytest.raises(TypeError):
+        Validated(1)